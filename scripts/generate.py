@@ -7,30 +7,54 @@ Supports proposal reports and major project reports.
 """
 
 import argparse
+import functools
+import hashlib
+import importlib.util
+import json
 import os
+import re
 import shutil
 import sys
-from typing import Any, Dict, Optional
-
-try:
-    import yaml
-    from jinja2 import Environment, FileSystemLoader
-
-    DEPENDENCIES_AVAILABLE = True
-except ImportError:
-    DEPENDENCIES_AVAILABLE = False
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from jinja2 import BytecodeCache, Environment
+
+# Only check that yaml/jinja2 are installed here; they are imported where
+# they are used so that e.g. --help does not pay their import cost.
+DEPENDENCIES_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None for name in ("yaml", "jinja2")
+)
+if not DEPENDENCIES_AVAILABLE:
     print("[WARNING] Required dependencies not found.")
     print("Please install dependencies: pip install -r scripts/requirements.txt")
     print("Or use the zero-dependency version: python scripts/generate_simple.py")
     sys.exit(1)
 
-# Add repo root for `scripts.utils.*` and utils/ for flat imports.
+# Add repo root for `scripts.utils.*` and utils/ for flat imports; the utils
+# modules themselves are imported lazily by the functions that need them.
 _script_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, os.path.join(_script_dir, ".."))
 sys.path.insert(0, os.path.join(_script_dir, "utils"))
 
-from template_engine import prepare_context  # noqa: E402
-from validators import validate_config, validate_email  # noqa: E402
+# Characters dropped from output directory slugs: anything that is not
+# alphanumeric (Unicode-aware, like str.isalnum) or a hyphen.
+_SLUG_RE = re.compile(r"[^\w-]|_")
+
+# Characters of a config file read when only the project header is needed.
+_HEADER_PEEK_SIZE = 4096
+
+# File in the output directory recording the context of the last render.
+_CONTEXT_HASH_FILE = ".ctxhash"
+
+# Upper bound on threads used to render .tex templates concurrently.
+_MAX_RENDER_WORKERS = 8
+
+# The yaml module and its safe loader class, resolved once by _yaml() when a
+# config is first read.
+_YAML: Optional[Tuple[Any, Any]] = None
 
 DEFAULTS = {
     "university": "Your University Name",
@@ -49,6 +73,17 @@ def print_banner() -> None:
     print()
 
 
+def _enable_line_editing() -> None:
+    """Enable readline editing/history for input() where available.
+
+    Imported only on the interactive path so scripted runs don't load it.
+    """
+    try:
+        import readline  # noqa: F401
+    except ImportError:  # e.g. Windows without pyreadline
+        pass
+
+
 def get_user_input(
     prompt: str, default: Optional[str] = None, required: bool = True
 ) -> str:
@@ -85,6 +120,9 @@ def collect_interactive_inputs() -> Dict[str, Any]:
     Returns:
         Configuration dictionary
     """
+    from validators import validate_email
+
+    _enable_line_editing()
     print_banner()
 
     print("Report type:")
@@ -183,6 +221,18 @@ def collect_interactive_inputs() -> Dict[str, Any]:
     return config
 
 
+def _yaml() -> Tuple[Any, Any]:
+    """Return the yaml module and the fastest available safe loader class."""
+    global _YAML
+    if _YAML is None:
+        import yaml
+
+        # libyaml's C loader parses several times faster than the pure-Python
+        # one; fall back transparently when PyYAML was built without it.
+        _YAML = (yaml, getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    return _YAML
+
+
 def load_config_file(config_path: str) -> Dict[str, Any]:
     """Load configuration from YAML file.
 
@@ -192,51 +242,269 @@ def load_config_file(config_path: str) -> Dict[str, Any]:
     Returns:
         Configuration dictionary
     """
+    yaml, loader = _yaml()
+
     with open(config_path, "r", encoding="utf-8") as f:
-        config: Dict[str, Any] = yaml.safe_load(f)
+        config: Dict[str, Any] = yaml.load(f, Loader=loader)  # nosec B506
     return config
 
 
-def copy_template_files(template_type: str, output_dir: str, script_dir: str) -> None:
-    """Copy non-.tex template files to output directory.
+def _peek_project_header(
+    config_path: str, prefix_size: int = _HEADER_PEEK_SIZE
+) -> Dict[str, Any]:
+    """Read only the ``project`` block of a YAML config file.
+
+    Parses a short prefix of the file first. The result is used only when the
+    whole file fit in the prefix or another top-level key follows
+    ``project``, i.e. the block is known to be complete. Otherwise the full
+    file is parsed.
+
+    Args:
+        config_path: Path to YAML config file
+        prefix_size: Number of characters to read for the fast path
+
+    Returns:
+        The ``project`` mapping (empty if absent)
+    """
+    yaml, loader = _yaml()
+
+    with open(config_path, "r", encoding="utf-8") as f:
+        prefix = f.read(prefix_size)
+        complete = not f.read(1)
+
+    if not complete:
+        # Drop the trailing partial line so the prefix ends on a boundary.
+        prefix = prefix[: prefix.rfind("\n") + 1]
+
+    try:
+        header = yaml.load(prefix, Loader=loader)  # nosec B506
+    except yaml.YAMLError:
+        header = None
+
+    if isinstance(header, dict) and "project" in header:
+        keys = list(header)
+        if complete or keys.index("project") < len(keys) - 1:
+            project = header["project"]
+            return project if isinstance(project, dict) else {}
+
+    project = load_config_file(config_path).get("project")
+    return project if isinstance(project, dict) else {}
+
+
+def _is_tex_template(name: str) -> bool:
+    """Return True for template names that Jinja2 should render."""
+    return name.endswith(".tex")
+
+
+def _scan_tree(top: str, prefix: str = "") -> Iterator[Tuple[str, str]]:
+    """Yield (relative path, source path) for every file below a directory.
+
+    Uses os.scandir so directory entries carry their file type and no extra
+    stat call is needed per entry, unlike os.walk followed by os.path.relpath.
+
+    Args:
+        top: Directory to scan
+        prefix: Relative path of top, used when recursing
+
+    Yields:
+        Tuples of (path relative to the scan root, absolute source path)
+    """
+    with os.scandir(top) as it:
+        entries = list(it)
+
+    for entry in entries:
+        rel_path = prefix + entry.name
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scan_tree(entry.path, rel_path + os.sep)
+        else:
+            yield rel_path, entry.path
+
+
+def _walk_template(template_dir: str) -> Iterator[Tuple[str, str, bool]]:
+    """Yield every file of a template directory in a single traversal.
+
+    Args:
+        template_dir: Path to template directory
+
+    Yields:
+        Tuples of (relative path, source path, whether it is a .tex template)
+    """
+    for rel_path, src_path in _scan_tree(template_dir):
+        yield rel_path, src_path, _is_tex_template(rel_path)
+
+
+def _context_digest(template_type: str, context: Dict[str, Any]) -> str:
+    """Return a short stable hash of the render inputs."""
+    payload = json.dumps([template_type, context], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _is_up_to_date(src_path: str, dst_path: str) -> bool:
+    """Return True if dst_path exists and is not older than src_path."""
+    try:
+        return os.stat(dst_path).st_mtime_ns >= os.stat(src_path).st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def _render_to_file(
+    env: "Environment", template_name: str, context: Dict[str, Any], dst_path: str
+) -> None:
+    """Render one template and stream the result to dst_path.
+
+    Streaming writes each rendered chunk through the file's buffer instead of
+    first joining the whole document into a single string.
+    """
+    template = env.get_template(template_name)
+    with open(dst_path, "w", encoding="utf-8") as f:
+        f.writelines(template.generate(**context))
+
+
+def _emit_template(
+    template_type: str,
+    output_dir: str,
+    script_dir: str,
+    context: Optional[Dict[str, Any]] = None,
+    copy_assets: bool = True,
+    incremental: bool = False,
+) -> None:
+    """Copy and/or render a template directory into the output directory.
+
+    Walks the template tree once; .tex files are rendered when a context is
+    given and every other file is copied when copy_assets is set. Renders are
+    independent, so they run on a small thread pool sharing the environment.
+
+    In incremental mode, files whose output is not older than the template
+    are skipped; rendered files additionally require the context hash stored
+    in the output directory to match. The hash file is only kept by
+    incremental runs; other runs remove it.
 
     Args:
         template_type: Type of template ('proposal', 'major-project', or 'presentation')
         output_dir: Output directory path
         script_dir: Script directory path
+        context: Template context variables, or None to skip rendering
+        copy_assets: Whether to copy non-.tex files
+        incremental: Whether to skip outputs that are already up to date
     """
     template_dir = os.path.join(script_dir, "..", "templates", template_type)
 
     if not os.path.exists(template_dir):
         raise FileNotFoundError(f"Template directory not found: {template_dir}")
 
-    for root, _, files in os.walk(template_dir):
-        for file in files:
-            if file.endswith(".tex"):
+    created_dirs: Set[str] = set()
+    render_jobs: List[Tuple[str, str]] = []
+
+    digest_path = os.path.join(output_dir, _CONTEXT_HASH_FILE)
+    digest = None if context is None else _context_digest(template_type, context)
+    context_unchanged = False
+    if incremental and digest is not None:
+        try:
+            context_unchanged = Path(digest_path).read_text(encoding="utf-8") == digest
+        except OSError:
+            context_unchanged = False
+    if digest is not None and not context_unchanged:
+        # Drop any old digest before outputs start changing, so a failed run
+        # cannot leave it vouching for files rendered from another context.
+        # Non-incremental runs never keep one.
+        Path(digest_path).unlink(missing_ok=True)
+
+    # Plain concatenation onto a separator-terminated prefix is much cheaper
+    # than os.path.join for every file.
+    out_prefix = os.path.join(output_dir, "")
+
+    for rel_path, src_path, is_tex in _walk_template(template_dir):
+        if is_tex:
+            if context is None:
                 continue
+        elif not copy_assets:
+            continue
+
+        dst_path = out_prefix + rel_path
+        if (
+            incremental
+            and (context_unchanged or not is_tex)
+            and _is_up_to_date(src_path, dst_path)
+        ):
+            continue
+
+        dst_parent = os.path.dirname(dst_path)
+        if dst_parent not in created_dirs:
+            os.makedirs(dst_parent, exist_ok=True)
+            created_dirs.add(dst_parent)
+
+        if is_tex:
+            # Jinja2 template names always use forward slashes.
+            render_jobs.append((rel_path.replace(os.sep, "/"), dst_path))
+        else:
+            # copy2 already uses sendfile()/fcopyfile() zero-copy on Linux/macOS.
+            shutil.copy2(src_path, dst_path)
 
-            src_path = os.path.join(root, file)
-            rel_path = os.path.relpath(src_path, template_dir)
-            dst_path = os.path.join(output_dir, rel_path)
+    if context is not None and render_jobs:
+        env = _get_environment(template_dir)
+        workers = min(_MAX_RENDER_WORKERS, os.cpu_count() or 1, len(render_jobs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_render_to_file, env, name, context, dst_path)
+                for name, dst_path in render_jobs
+            ]
+            for future in futures:
+                future.result()
 
-            os.makedirs(os.path.dirname(dst_path), exist_ok=True)
-            shutil.copy2(src_path, dst_path)
+    # Written only once every render has succeeded.
+    if incremental and digest is not None and not context_unchanged:
+        os.makedirs(output_dir, exist_ok=True)
+        Path(digest_path).write_text(digest, encoding="utf-8")
 
 
-def render_templates(
-    template_type: str, context: Dict[str, Any], output_dir: str, script_dir: str
-) -> None:
-    """Render all .tex template files with Jinja2.
+def copy_template_files(template_type: str, output_dir: str, script_dir: str) -> None:
+    """Copy non-.tex template files to output directory.
 
     Args:
         template_type: Type of template ('proposal', 'major-project', or 'presentation')
-        context: Template context variables
         output_dir: Output directory path
         script_dir: Script directory path
     """
-    template_dir = os.path.join(script_dir, "..", "templates", template_type)
+    _emit_template(template_type, output_dir, script_dir)
+
+
+def _get_bytecode_cache() -> Optional["BytecodeCache"]:
+    """Return an on-disk cache for compiled template bytecode.
+
+    Compiled templates are persisted between runs (in $IITJ_JINJA_CACHE_DIR
+    or Jinja2's per-user temp directory), so later runs skip lexing and
+    parsing.
+
+    Returns:
+        Bytecode cache, or None if no usable cache directory exists
+    """
+    from scripts.utils.performance import get_bytecode_cache
+
+    return get_bytecode_cache()
+
+
+def _get_environment(template_dir: str) -> "Environment":
+    """Return the Jinja2 environment for a template directory.
+
+    Environments are cached per directory so compiled templates are reused
+    across renders instead of being lexed and parsed again on every call.
+    The path is normalized first so equivalent spellings share one entry.
+
+    Args:
+        template_dir: Path to template directory
+
+    Returns:
+        Configured Jinja2 Environment
+    """
+    return _build_environment(os.path.abspath(template_dir))
 
-    env = Environment(  # nosec B701
+
+@functools.lru_cache(maxsize=8)
+def _build_environment(template_dir: str) -> "Environment":
+    """Create the Jinja2 environment for a normalized template directory."""
+    from jinja2 import Environment, FileSystemLoader
+
+    return Environment(  # nosec B701
         loader=FileSystemLoader(template_dir),
         block_start_string="\\BLOCK{",
         block_end_string="}",
@@ -246,36 +514,50 @@ def render_templates(
         comment_end_string="}",
         trim_blocks=True,
         lstrip_blocks=True,
+        auto_reload=False,
+        bytecode_cache=_get_bytecode_cache(),
     )
 
-    for root, _, files in os.walk(template_dir):
-        for file in files:
-            if file.endswith(".tex"):
-                src_path = os.path.join(root, file)
-                rel_path = os.path.relpath(src_path, template_dir)
-                dst_path = os.path.join(output_dir, rel_path)
 
-                template_rel_path = os.path.relpath(src_path, template_dir).replace(
-                    "\\", "/"
-                )
-                template = env.get_template(template_rel_path)
-                rendered = template.render(**context)
+def render_templates(
+    template_type: str, context: Dict[str, Any], output_dir: str, script_dir: str
+) -> None:
+    """Render all .tex template files with Jinja2.
+
+    Args:
+        template_type: Type of template ('proposal', 'major-project', or 'presentation')
+        context: Template context variables
+        output_dir: Output directory path
+        script_dir: Script directory path
+    """
+    _emit_template(template_type, output_dir, script_dir, context, copy_assets=False)
+
 
-                os.makedirs(os.path.dirname(dst_path), exist_ok=True)
-                with open(dst_path, "w", encoding="utf-8") as f:
-                    f.write(rendered)
+def _default_output_dir(title: str) -> str:
+    """Return the default output directory for a project title."""
+    title_slug = _SLUG_RE.sub("", title.lower().replace(" ", "-"))
+    return os.path.join("output", title_slug)
 
 
-def generate_report(config: Dict[str, Any], output_dir: Optional[str] = None) -> str:
+def generate_report(
+    config: Dict[str, Any],
+    output_dir: Optional[str] = None,
+    incremental: bool = False,
+) -> str:
     """Generate report from configuration.
 
     Args:
         config: Configuration dictionary
         output_dir: Optional output directory path
+        incremental: Skip files whose output is already up to date
 
     Returns:
         Path to generated report directory
     """
+    # Imported here so --help and --dry-run skip loading Jinja2 entirely.
+    from template_engine import prepare_context
+    from validators import validate_config
+
     is_valid, errors = validate_config(config)
     if not is_valid:
         print("\n[ERROR] Configuration validation failed:")
@@ -284,9 +566,7 @@ def generate_report(config: Dict[str, Any], output_dir: Optional[str] = None) ->
         sys.exit(1)
 
     if not output_dir:
-        title_slug = config["project"]["title"].lower().replace(" ", "-")
-        title_slug = "".join(c for c in title_slug if c.isalnum() or c == "-")
-        output_dir = os.path.join("output", title_slug)
+        output_dir = _default_output_dir(config["project"]["title"])
 
     os.makedirs(output_dir, exist_ok=True)
 
@@ -327,11 +607,10 @@ def generate_report(config: Dict[str, Any], output_dir: Optional[str] = None) ->
 
     context = prepare_context(config)
 
-    print("   Copying template files...")
-    copy_template_files(template_type, output_dir, script_dir)
-
-    print("   Rendering LaTeX templates...")
-    render_templates(template_type, context, output_dir, script_dir)
+    print("   Copying and rendering template files...")
+    _emit_template(
+        template_type, output_dir, script_dir, context, incremental=incremental
+    )
 
     print("\n[OK] Report generated successfully!")
     print(f"[INFO] Output directory: {os.path.abspath(output_dir)}")
@@ -354,6 +633,9 @@ Examples:
 
   # Specify output directory
   python scripts/generate.py --config config.yaml --output my-report
+
+  # Show what would be generated without writing anything
+  python scripts/generate.py --config config.yaml --dry-run
         """,
     )
 
@@ -371,13 +653,38 @@ Examples:
         type=str,
     )
 
+    parser.add_argument(
+        "--incremental",
+        help="Only regenerate files whose template or configuration changed",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        help="Show the report type and output directory without generating",
+        action="store_true",
+    )
+
     args = parser.parse_args()
 
+    if args.dry_run and not args.config:
+        parser.error("--dry-run requires --config")
+
     if args.config:
         if not os.path.exists(args.config):
             print(f"[ERROR] Config file not found: {args.config}")
             sys.exit(1)
 
+        if args.dry_run:
+            project = _peek_project_header(args.config)
+            title = str(project.get("title", ""))
+            print(f"[INFO] Type: {project.get('type', 'unknown')}")
+            print(f"[INFO] Title: {title}")
+            print(
+                f"[INFO] Output directory: {args.output or _default_output_dir(title)}"
+            )
+            return
+
         config = load_config_file(args.config)
         print(f"[OK] Loaded configuration from: {args.config}")
     else:
@@ -398,7 +705,7 @@ Examples:
             print("[ERROR] Generation cancelled.")
             sys.exit(0)
 
-    output_dir = generate_report(config, args.output)
+    output_dir = generate_report(config, args.output, incremental=args.incremental)
 
     print("\n[INFO] Important:")
     print(
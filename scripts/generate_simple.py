@@ -7,11 +7,45 @@ No external dependencies required (no Jinja2, no PyYAML).
 Uses JSON for configuration and simple string replacement for templating.
 """
 
+import hashlib
 import json
 import os
+import re
 import shutil
 import sys
-from typing import Any
+from pathlib import Path
+from typing import Any, Callable
+
+_json_loads: Callable[[bytes], Any]
+try:  # Optional speedup; the standard library parser is always available.
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Characters dropped from output directory slugs: anything that is not
+# alphanumeric (Unicode-aware, like str.isalnum) or a hyphen.
+_SLUG_RE = re.compile(r"[^\w-]|_")
+
+# File in the output directory recording the inputs of the last run.
+_CONTEXT_HASH_FILE = ".ctxhash"
+
+# One alternation covering every placeholder form, so each template is
+# scanned once instead of twice per replacement key.
+_PLACEHOLDER_RE = re.compile(r"\\VAR\{(\w+)\}|\{\{(\w+)\}\}|\\BLOCK\{(if \w+|endif)\}")
+
+# Jinja2 block markers that the simple generator drops (basic cleanup).
+_STRIPPED_BLOCKS = frozenset(
+    {
+        "if INCLUDE_DECLARATION",
+        "if INCLUDE_CERTIFICATE",
+        "if INCLUDE_ACKNOWLEDGMENTS",
+        "if INCLUDE_ABSTRACT",
+        "if INCLUDE_GLOSSARY",
+        "endif",
+    }
+)
 
 
 def print_banner():
@@ -25,6 +59,14 @@ def print_banner():
     print()
 
 
+def _enable_line_editing():
+    """Turn on readline line editing for the prompts, if the platform has it."""
+    try:
+        import readline  # noqa: F401
+    except ImportError:
+        pass
+
+
 def get_user_input(prompt, default=None, required=True):
     """Get user input with optional default value."""
     if default:
@@ -46,6 +88,7 @@ def get_user_input(prompt, default=None, required=True):
 
 def collect_inputs():
     """Collect inputs interactively from user."""
+    _enable_line_editing()
     print_banner()
 
     print("Report type:")
@@ -110,18 +153,69 @@ def collect_inputs():
     return config
 
 
+def _substitute(text, replacements):
+    """Apply placeholder substitution using already-stringified values."""
+
+    def _replace(match):
+        block = match.group(3)
+        if block is not None:
+            return "" if block in _STRIPPED_BLOCKS else match.group(0)
+        value = replacements.get(match.group(1) or match.group(2))
+        return match.group(0) if value is None else value
+
+    return _PLACEHOLDER_RE.sub(_replace, text)
+
+
 def simple_replace(text, replacements):
-    """Simple string replacement."""
-    result = text
-    for key, value in replacements.items():
-        # Handle both Jinja2-style and simple placeholders
-        result = result.replace(f"\\VAR{{{key}}}", str(value))
-        result = result.replace(f"{{{{{key}}}}}", str(value))
-    return result
+    """Simple string replacement.
+
+    Substitutes both Jinja2-style (\\VAR{KEY}) and simple ({{KEY}})
+    placeholders and drops the known \\BLOCK{if ...}/\\BLOCK{endif} markers
+    in a single pass. Unknown placeholders are left untouched.
+    """
+    return _substitute(text, {key: str(value) for key, value in replacements.items()})
+
+
+def _scan_tree(top, prefix=""):
+    """Yield (relative path, source path) for every file below a directory.
+
+    Uses os.scandir so DirEntry.path and the cached entry type replace the
+    per-file os.path.join/os.path.relpath calls of an os.walk loop.
+    """
+    with os.scandir(top) as it:
+        entries = list(it)
+
+    for entry in entries:
+        rel_path = prefix + entry.name
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scan_tree(entry.path, rel_path + os.sep)
+        else:
+            yield rel_path, entry.path
+
+
+def _context_digest(template_type, replacements):
+    """Return a short stable hash of the substitution inputs."""
+    payload = json.dumps([template_type, replacements], sort_keys=True)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
 
+def _is_up_to_date(src_path, dst_path):
+    """Return True if dst_path exists and is not older than src_path."""
+    try:
+        return os.stat(dst_path).st_mtime_ns >= os.stat(src_path).st_mtime_ns
+    except FileNotFoundError:
+        return False
 
-def copy_and_process_files(template_type, config, output_dir, script_dir):
-    """Copy and process template files."""
+
+def copy_and_process_files(
+    template_type, config, output_dir, script_dir, incremental=False
+):
+    """Copy and process template files.
+
+    With incremental=True, outputs that are not older than their template are
+    skipped; processed .tex files also require an unchanged configuration.
+    The configuration hash file is only kept by incremental runs.
+    """
     template_dir = os.path.join(script_dir, "..", "templates", template_type)
 
     if not os.path.exists(template_dir):
@@ -166,41 +260,66 @@ def copy_and_process_files(template_type, config, output_dir, script_dir):
             else "false"
         ),
     }
-
-    for root, _, files in os.walk(template_dir):
-        for file in files:
-            src_path = os.path.join(root, file)
-            rel_path = os.path.relpath(src_path, template_dir)
-            dst_path = os.path.join(output_dir, rel_path)
-
-            os.makedirs(os.path.dirname(dst_path), exist_ok=True)
-
-            if file.endswith(".tex"):
-                with open(src_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                # Simple replacement (won't handle Jinja2 blocks perfectly)
-                processed = simple_replace(content, replacements)
-
-                # Remove Jinja2 block statements (basic cleanup)
-                processed = processed.replace("\\BLOCK{if INCLUDE_DECLARATION}", "")
-                processed = processed.replace("\\BLOCK{if INCLUDE_CERTIFICATE}", "")
-                processed = processed.replace("\\BLOCK{if INCLUDE_ACKNOWLEDGMENTS}", "")
-                processed = processed.replace("\\BLOCK{if INCLUDE_ABSTRACT}", "")
-                processed = processed.replace("\\BLOCK{if INCLUDE_GLOSSARY}", "")
-                processed = processed.replace("\\BLOCK{endif}", "")
-
-                with open(dst_path, "w", encoding="utf-8") as f:
-                    f.write(processed)
-            else:
-                shutil.copy2(src_path, dst_path)
-
-
-def generate_report(config, output_dir=None):
+    # Stringify once instead of once per placeholder per file.
+    replacements = {key: str(value) for key, value in replacements.items()}
+
+    digest_path = os.path.join(output_dir, _CONTEXT_HASH_FILE)
+    digest = _context_digest(template_type, replacements)
+    context_unchanged = False
+    if incremental:
+        try:
+            context_unchanged = Path(digest_path).read_text(encoding="utf-8") == digest
+        except OSError:
+            context_unchanged = False
+    if not context_unchanged:
+        # Drop any old digest before outputs start changing, so a failed run
+        # cannot leave it vouching for files made from another configuration.
+        # Non-incremental runs never keep one.
+        Path(digest_path).unlink(missing_ok=True)
+
+    # Plain concatenation onto a separator-terminated prefix is much cheaper
+    # than os.path.join for every file.
+    out_prefix = os.path.join(output_dir, "")
+    # Directories already ensured, so makedirs runs once per directory.
+    created_dirs = set()
+
+    for rel_path, src_path in _scan_tree(template_dir):
+        dst_path = out_prefix + rel_path
+        is_tex = rel_path.endswith(".tex")
+
+        if (
+            incremental
+            and (context_unchanged or not is_tex)
+            and _is_up_to_date(src_path, dst_path)
+        ):
+            continue
+
+        dst_parent = os.path.dirname(dst_path)
+        if dst_parent not in created_dirs:
+            os.makedirs(dst_parent, exist_ok=True)
+            created_dirs.add(dst_parent)
+
+        if is_tex:
+            content = Path(src_path).read_text(encoding="utf-8")
+
+            # Simple replacement (won't handle Jinja2 blocks perfectly)
+            processed = _substitute(content, replacements)
+
+            Path(dst_path).write_text(processed, encoding="utf-8")
+        else:
+            shutil.copy2(src_path, dst_path)
+
+    # Written only once every file has been processed.
+    if incremental and not context_unchanged:
+        os.makedirs(output_dir, exist_ok=True)
+        Path(digest_path).write_text(digest, encoding="utf-8")
+
+
+def generate_report(config, output_dir=None, incremental=False):
     """Generate report from configuration."""
     if not output_dir:
         title_slug = config["project"]["title"].lower().replace(" ", "-")
-        title_slug = "".join(c for c in title_slug if c.isalnum() or c == "-")
+        title_slug = _SLUG_RE.sub("", title_slug)
         output_dir = os.path.join("output", title_slug)
 
     os.makedirs(output_dir, exist_ok=True)
@@ -211,7 +330,9 @@ def generate_report(config, output_dir=None):
     print(f"\n[INFO] Generating {template_type} report...")
     print("   Processing template files...")
 
-    copy_and_process_files(template_type, config, output_dir, script_dir)
+    copy_and_process_files(
+        template_type, config, output_dir, script_dir, incremental=incremental
+    )
 
     print("\n[OK] Report generated successfully!")
     print(f"[INFO] Output directory: {os.path.abspath(output_dir)}")
@@ -242,6 +363,12 @@ def main():
         type=str,
     )
 
+    parser.add_argument(
+        "--incremental",
+        help="Only regenerate files whose template or configuration changed",
+        action="store_true",
+    )
+
     args = parser.parse_args()
 
     if args.config:
@@ -249,8 +376,7 @@ def main():
             print(f"[ERROR] Config file not found: {args.config}")
             sys.exit(1)
 
-        with open(args.config, "r", encoding="utf-8") as f:
-            config = json.load(f)
+        config = _json_loads(Path(args.config).read_bytes())
         print(f"[OK] Loaded configuration from: {args.config}")
     else:
         config = collect_inputs()
@@ -270,7 +396,7 @@ def main():
             print("[ERROR] Generation cancelled.")
             sys.exit(0)
 
-    output_dir = generate_report(config, args.output)
+    output_dir = generate_report(config, args.output, incremental=args.incremental)
 
     print("\n[INFO] Important:")
     print(
@@ -4,16 +4,18 @@ This module extracts relevant content from proposal and major project
 reports to automatically populate presentation slides.
 """
 
+import copy
+import functools
 import os
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
 
 from .latex_parser import (
+    LatexIndex,
     clean_latex,
-    extract_chapter,
     extract_environment,
     extract_first_paragraph,
     extract_itemize_list,
-    extract_section,
     extract_subsection,
 )
 
@@ -21,6 +23,8 @@ from .latex_parser import (
 class ContentExtractor:
     """Extract content from LaTeX reports for presentations."""
 
+    __slots__ = ("content", "report_path", "report_dir", "_index")
+
     def __init__(self, report_path: str):
         """Initialize with path to LaTeX report.
 
@@ -33,11 +37,13 @@ class ContentExtractor:
         if not os.path.exists(report_path):
             raise FileNotFoundError(f"Report not found: {report_path}")
 
-        with open(report_path, "r", encoding="utf-8", errors="ignore") as f:
+        # utf-8-sig drops a leading BOM left by some Windows editors.
+        with open(report_path, "r", encoding="utf-8-sig", errors="ignore") as f:
             self.content = f.read()
 
         self.report_path = report_path
         self.report_dir = os.path.dirname(report_path)
+        self._index = LatexIndex(self.content)
 
     def extract_for_presentation(self) -> Dict[str, Any]:
         """Extract all relevant content for presentation.
@@ -59,9 +65,9 @@ class ContentExtractor:
         Returns:
             Dictionary with motivation and problem statement
         """
-        intro_content = extract_section(self.content, "Introduction")
+        intro_content = self._index.section("Introduction")
         if not intro_content:
-            intro_content = extract_chapter(self.content, "Introduction")
+            intro_content = self._index.chapter("Introduction")
 
         if not intro_content:
             abstract = extract_environment(self.content, "abstract")
@@ -96,13 +102,13 @@ class ContentExtractor:
         Returns:
             List of objective strings
         """
-        obj_content = extract_section(self.content, "Objectives")
+        obj_content = self._index.section("Objectives")
         if not obj_content:
-            obj_content = extract_subsection(self.content, "Objectives")
+            obj_content = self._index.subsection("Objectives")
 
         if not obj_content:
             for name in ["Research Objectives", "Project Objectives", "Goals"]:
-                obj_content = extract_section(self.content, name)
+                obj_content = self._index.section(name)
                 if obj_content:
                     break
 
@@ -118,13 +124,13 @@ class ContentExtractor:
         Returns:
             Dictionary with methodology overview and key points
         """
-        method_content = extract_section(self.content, "Methodology")
+        method_content = self._index.section("Methodology")
         if not method_content:
-            method_content = extract_chapter(self.content, "Methodology")
+            method_content = self._index.chapter("Methodology")
 
         if not method_content:
             for name in ["Proposed Solution", "Approach", "Design", "Implementation"]:
-                method_content = extract_section(self.content, name)
+                method_content = self._index.section(name)
                 if method_content:
                     break
 
@@ -158,13 +164,13 @@ class ContentExtractor:
         Returns:
             Dictionary with implementation and evaluation content
         """
-        results_content = extract_section(self.content, "Results")
+        results_content = self._index.section("Results")
         if not results_content:
-            results_content = extract_chapter(self.content, "Results")
+            results_content = self._index.chapter("Results")
 
         if not results_content:
             for name in ["Implementation", "Evaluation", "Experiments"]:
-                results_content = extract_section(self.content, name)
+                results_content = self._index.section(name)
                 if results_content:
                     break
 
@@ -194,9 +200,9 @@ class ContentExtractor:
         Returns:
             Dictionary with summary and future work
         """
-        concl_content = extract_section(self.content, "Conclusion")
+        concl_content = self._index.section("Conclusion")
         if not concl_content:
-            concl_content = extract_chapter(self.content, "Conclusion")
+            concl_content = self._index.chapter("Conclusion")
 
         if not concl_content:
             return {}
@@ -217,10 +223,21 @@ class ContentExtractor:
         }
 
 
+@functools.lru_cache(maxsize=32)
+def _extract_cached(report_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Extract a report, memoized on its path, mtime and size.
+
+    A rewritten file changes the key, so stale entries are never returned.
+    """
+    return ContentExtractor(report_path).extract_for_presentation()
+
+
 def extract_content_from_report(report_path: str) -> Optional[Dict[str, Any]]:
     """Extract content from a LaTeX report.
 
-    Convenience function for extracting content.
+    Convenience function for extracting content. Results are cached while
+    the file is unchanged, so a report shared by several builds is parsed
+    once.
 
     Args:
         report_path: Path to LaTeX report file
@@ -229,8 +246,37 @@ def extract_content_from_report(report_path: str) -> Optional[Dict[str, Any]]:
         Extracted content dictionary or None if extraction fails
     """
     try:
-        extractor = ContentExtractor(report_path)
-        return extractor.extract_for_presentation()
+        st = os.stat(report_path)
+        extracted = _extract_cached(
+            os.path.abspath(report_path), st.st_mtime_ns, st.st_size
+        )
+        # Callers own the result; keep the cached copy pristine.
+        return copy.deepcopy(extracted)
     except Exception as e:
         print(f"[WARNING] Content extraction failed: {e}")
         return None
+
+
+def extract_content_from_reports(
+    report_paths: Sequence[str], max_workers: Optional[int] = None
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Extract content from several LaTeX reports in parallel.
+
+    Recommended for batch use: LaTeX cleaning is CPU-bound regex work that
+    holds the GIL, so reports are spread over worker processes rather than
+    threads. A single report is extracted in-process.
+
+    Args:
+        report_paths: Paths to LaTeX report files
+        max_workers: Maximum number of worker processes (default: CPU count)
+
+    Returns:
+        Mapping of each report path to its extracted content, or None if
+        extraction failed
+    """
+    if len(report_paths) <= 1:
+        return {path: extract_content_from_report(path) for path in report_paths}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(extract_content_from_report, report_paths, chunksize=4)
+        return dict(zip(report_paths, results))
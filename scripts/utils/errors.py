@@ -4,7 +4,7 @@ This module provides user-friendly error messages with actionable suggestions
 and links to documentation.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 
 class GeneratorError(Exception):
@@ -13,18 +13,18 @@ class GeneratorError(Exception):
     def __init__(
         self,
         message: str,
-        suggestions: Optional[List[str]] = None,
+        suggestions: Optional[Sequence[str]] = None,
         doc_link: Optional[str] = None,
     ):
         """Initialize error with message, suggestions, and documentation link.
 
         Args:
             message: Error message
-            suggestions: List of helpful suggestions
+            suggestions: Helpful suggestions
             doc_link: Link to relevant documentation
         """
         self.message = message
-        self.suggestions = suggestions or []
+        self.suggestions: List[str] = list(suggestions or ())
         self.doc_link = doc_link
         super().__init__(self.format_error())
 
@@ -59,17 +59,62 @@ class ValidationError(GeneratorError):
     """Validation errors."""
 
 
+# Fixed suggestion lists and documentation links, shared by every error a
+# helper builds rather than rebuilt per call.
+_DOCS = "https://satishjhanwer.github.io/IITJ-MTP-Template-Generator/"
+
+_CONFIG_NOT_FOUND_SUGGESTIONS = (
+    "Check that the file path is correct",
+    "Ensure the file exists in the specified location",
+    "Try using an absolute path instead of relative",
+    "Run in interactive mode: python scripts/generate.py",
+)
+_INVALID_YAML_SUGGESTIONS = (
+    "Check for proper indentation (use spaces, not tabs)",
+    "Ensure all strings with special characters are quoted",
+    "Validate your YAML at https://www.yamllint.com/",
+    "Compare with example configs in examples/ directory",
+)
+_MISSING_FIELD_SUGGESTIONS = (
+    "Check the example configs in examples/ directory",
+    "Refer to the input schema documentation for required fields",
+)
+_INVALID_PROJECT_TYPE_SUGGESTIONS = (
+    "Valid types are: 'proposal', 'major-project', 'presentation'",
+    "Check your config file's 'project.type' field",
+    "Use interactive mode to select the correct type",
+)
+_TEMPLATE_NOT_FOUND_SUGGESTIONS = (
+    "Ensure you're running the script from the project root",
+    "Check that templates/ directory exists",
+    "Verify the repository is complete (not corrupted)",
+    "Try re-cloning the repository",
+)
+_OUTPUT_EXISTS_SUGGESTIONS = (
+    "Remove or rename the existing directory",
+    "Specify a different output directory with --output flag",
+    "Backup the existing directory if it contains important work",
+)
+_LATEX_FAILED_SUGGESTIONS = (
+    "Check the LaTeX log file for detailed errors",
+    "Ensure LaTeX is installed (TeX Live, MiKTeX, or MacTeX)",
+    "Verify all required LaTeX packages are installed",
+    "Try compiling manually to see the full error output",
+)
+_EXTRACTION_FAILED_SUGGESTIONS = (
+    "Verify the report file is valid LaTeX",
+    "Check that the file path is correct",
+    "Ensure the report uses standard section names",
+    "Try generating without extraction (set extract_from_report: false)",
+)
+
+
 def config_file_not_found(path: str) -> ConfigurationError:
     """Error when configuration file is not found."""
     return ConfigurationError(
         f"Configuration file not found: {path}",
-        suggestions=[
-            "Check that the file path is correct",
-            "Ensure the file exists in the specified location",
-            "Try using an absolute path instead of relative",
-            "Run in interactive mode: python scripts/generate.py",
-        ],
-        doc_link="https://satishjhanwer.github.io/IITJ-MTP-Template-Generator/input-schema",  # noqa: E501
+        suggestions=_CONFIG_NOT_FOUND_SUGGESTIONS,
+        doc_link=_DOCS + "input-schema",
     )
 
 
@@ -77,13 +122,8 @@ def invalid_yaml_syntax(path: str, error: str) -> ConfigurationError:
     """Error when YAML file has syntax errors."""
     return ConfigurationError(
         f"Invalid YAML syntax in {path}: {error}",
-        suggestions=[
-            "Check for proper indentation (use spaces, not tabs)",
-            "Ensure all strings with special characters are quoted",
-            "Validate your YAML at https://www.yamllint.com/",
-            "Compare with example configs in examples/ directory",
-        ],
-        doc_link="https://satishjhanwer.github.io/IITJ-MTP-Template-Generator/quickstart",  # noqa: E501
+        suggestions=_INVALID_YAML_SUGGESTIONS,
+        doc_link=_DOCS + "quickstart",
     )
 
 
@@ -91,12 +131,11 @@ def missing_required_field(field: str, section: str) -> ValidationError:
     """Error when required configuration field is missing."""
     return ValidationError(
         f"Missing required field '{field}' in '{section}' section",
-        suggestions=[
+        suggestions=(
             f"Add '{field}' to your configuration file",
-            "Check the example configs in examples/ directory",
-            "Refer to the input schema documentation for required fields",
-        ],
-        doc_link="https://satishjhanwer.github.io/IITJ-MTP-Template-Generator/input-schema",  # noqa: E501
+            *_MISSING_FIELD_SUGGESTIONS,
+        ),
+        doc_link=_DOCS + "input-schema",
     )
 
 
@@ -104,12 +143,8 @@ def invalid_project_type(provided: str) -> ValidationError:
     """Error when project type is invalid."""
     return ValidationError(
         f"Invalid project type: '{provided}'",
-        suggestions=[
-            "Valid types are: 'proposal', 'major-project', 'presentation'",
-            "Check your config file's 'project.type' field",
-            "Use interactive mode to select the correct type",
-        ],
-        doc_link="https://satishjhanwer.github.io/IITJ-MTP-Template-Generator/quickstart",  # noqa: E501
+        suggestions=_INVALID_PROJECT_TYPE_SUGGESTIONS,
+        doc_link=_DOCS + "quickstart",
     )
 
 
@@ -117,13 +152,8 @@ def template_not_found(template_type: str, path: str) -> TemplateError:
     """Error when template directory is not found."""
     return TemplateError(
         f"Template directory not found for '{template_type}' at {path}",
-        suggestions=[
-            "Ensure you're running the script from the project root",
-            "Check that templates/ directory exists",
-            "Verify the repository is complete (not corrupted)",
-            "Try re-cloning the repository",
-        ],
-        doc_link="https://satishjhanwer.github.io/IITJ-MTP-Template-Generator/",
+        suggestions=_TEMPLATE_NOT_FOUND_SUGGESTIONS,
+        doc_link=_DOCS,
     )
 
 
@@ -131,11 +161,7 @@ def output_directory_exists(path: str) -> FileError:
     """Error when output directory already exists."""
     return FileError(
         f"Output directory already exists: {path}",
-        suggestions=[
-            "Remove or rename the existing directory",
-            "Specify a different output directory with --output flag",
-            "Backup the existing directory if it contains important work",
-        ],
+        suggestions=_OUTPUT_EXISTS_SUGGESTIONS,
     )
 
 
@@ -143,13 +169,8 @@ def latex_compilation_failed(error: str) -> GeneratorError:
     """Error when LaTeX compilation fails."""
     return GeneratorError(
         f"LaTeX compilation failed: {error}",
-        suggestions=[
-            "Check the LaTeX log file for detailed errors",
-            "Ensure LaTeX is installed (TeX Live, MiKTeX, or MacTeX)",
-            "Verify all required LaTeX packages are installed",
-            "Try compiling manually to see the full error output",
-        ],
-        doc_link="https://satishjhanwer.github.io/IITJ-MTP-Template-Generator/faq",
+        suggestions=_LATEX_FAILED_SUGGESTIONS,
+        doc_link=_DOCS + "faq",
     )
 
 
@@ -157,11 +178,6 @@ def content_extraction_failed(report_path: str, error: str) -> GeneratorError:
     """Error when content extraction fails."""
     return GeneratorError(
         f"Content extraction failed from {report_path}: {error}",
-        suggestions=[
-            "Verify the report file is valid LaTeX",
-            "Check that the file path is correct",
-            "Ensure the report uses standard section names",
-            "Try generating without extraction (set extract_from_report: false)",
-        ],
-        doc_link="https://satishjhanwer.github.io/IITJ-MTP-Template-Generator/content-extraction",  # noqa: E501
+        suggestions=_EXTRACTION_FAILED_SUGGESTIONS,
+        doc_link=_DOCS + "content-extraction",
     )
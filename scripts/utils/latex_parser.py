@@ -4,8 +4,116 @@ This module provides functions to parse LaTeX documents and extract
 content from sections, environments, and lists.
 """
 
+import functools
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+# Lookaheads that end a heading's body: the next structural command,
+# \end{document}, or end of string.
+_DOC_END = r"\\end\{document\}"
+_HEADING_END = {
+    "section": rf"(?=\\section|\\chapter|{_DOC_END}|\Z)",
+    "subsection": r"(?=\\subsection|\\section|\\chapter|\Z)",
+    "chapter": rf"(?=\\chapter|{_DOC_END}|\Z)",
+}
+
+# Between a heading command and its title: an optional star (unnumbered
+# headings such as \chapter*{Abstract}) and optional whitespace.
+_HEADING_OPEN = r"\*?\s*\{"
+
+# Structural tokens for LatexIndex: headings (with their title when one
+# follows directly) and \end{document}. These are exactly the commands that
+# start or end a body in _HEADING_END.
+_STRUCTURE_RE = re.compile(
+    r"\\(?:(?P<kind>section|subsection|chapter)"
+    rf"(?:{_HEADING_OPEN}(?P<title>[^}}]*)\}})?"
+    r"|end\{document\})",
+    re.IGNORECASE,
+)
+
+# Markers that end the first paragraph in extract_first_paragraph.
+_PARAGRAPH_ENDS = ("\n\n", "\\section", "\\subsection")
+_LONGEST_PARAGRAPH_END = max(map(len, _PARAGRAPH_ENDS))
+
+# Every inline clean_latex rule as one alternation, so the text is scanned
+# once per nesting level instead of once per rule. Formatting commands and
+# \href keep their argument ("fmt"/"link"); everything else is dropped.
+# Kept arguments may not contain another command handled here, so inner
+# commands are resolved first and the enclosing one on the next pass.
+_CLEANED_COMMAND = (
+    r"citep?|ref|label|textbf|textit|emph|texttt|url|href|includegraphics"
+)
+_CLEAN_ARG = rf"(?:[^}}\\]|\\(?!{_CLEANED_COMMAND}))*"
+_CLEAN_RE = re.compile(
+    r"\\citep?\{[^}]+\}"
+    r"|\\ref\{[^}]+\}"
+    r"|\\label\{[^}]+\}"
+    rf"|\\(?:textbf|textit|emph|texttt)\{{(?P<fmt>{_CLEAN_ARG})\}}"
+    r"|\\url\{[^}]+\}"
+    rf"|\\href\{{[^}}]+\}}\{{(?P<link>{_CLEAN_ARG})\}}"
+    r"|%.*$"
+    r"|\\includegraphics.*?\{[^}]+\}",
+    re.MULTILINE,
+)
+_FIGURE_RE = re.compile(r"\\begin\{figure\}.*?\\end\{figure\}", re.DOTALL)
+_TABLE_RE = re.compile(r"\\begin\{table\}.*?\\end\{table\}", re.DOTALL)
+
+
+# Heading commands with their brace-delimited title, and the boundary that
+# ends each kind's body, for the substring title fallback.
+_HEADING_TITLE_RE = {
+    kind: re.compile(rf"\\{kind}{_HEADING_OPEN}([^}}]*)\}}", re.IGNORECASE)
+    for kind in _HEADING_END
+}
+_HEADING_BOUNDARY_RE = {
+    kind: re.compile(after, re.IGNORECASE) for kind, after in _HEADING_END.items()
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _heading_pattern(kind: str, name: str) -> re.Pattern[str]:
+    """Compile the exact-title pattern for a named heading.
+
+    Args:
+        kind: Heading command ('section', 'subsection' or 'chapter')
+        name: Heading title to look for
+
+    Returns:
+        Pattern capturing the heading's body
+    """
+    # Titles are literal text: escape them so e.g. "C++" or "(Draft)" work.
+    name = re.escape(name)
+    return re.compile(
+        rf"\\{kind}{_HEADING_OPEN}{name}\}}(.*?){_HEADING_END[kind]}",
+        re.DOTALL | re.IGNORECASE,
+    )
+
+
+def _find_heading_by_substring(content: str, kind: str, name: str) -> Optional[str]:
+    """Return the body of the first heading whose title contains name."""
+    needle = name.lower()
+    for match in _HEADING_TITLE_RE[kind].finditer(content):
+        if needle in match.group(1).lower():
+            start = match.end()
+            boundary = _HEADING_BOUNDARY_RE[kind].search(content, start)
+            stop = boundary.start() if boundary else len(content)
+            return content[start:stop].strip()
+    return None
+
+
+def _extract_heading(content: str, kind: str, name: str) -> Optional[str]:
+    """Return the stripped body of the first matching heading, if any."""
+    match = _heading_pattern(kind, name).search(content)
+    if match:
+        return match.group(1).strip()
+    return _find_heading_by_substring(content, kind, name)
+
+
+@functools.lru_cache(maxsize=64)
+def _environment_pattern(env_name: str) -> re.Pattern[str]:
+    """Compile the pattern matching a named environment's body."""
+    env_name = re.escape(env_name)
+    return re.compile(rf"\\begin\{{{env_name}\}}(.*?)\\end\{{{env_name}\}}", re.DOTALL)
 
 
 def extract_section(content: str, section_name: str) -> Optional[str]:
@@ -18,22 +126,7 @@ def extract_section(content: str, section_name: str) -> Optional[str]:
     Returns:
         Section content or None if not found
     """
-    # Try to match section with various patterns
-    # Lookahead: next structural command, literal \end{document}, or end of string.
-    # Note: \end{...} must use \\end in the pattern or \e is parsed as ESC in regex.
-    _end_doc = r"\\end\{{document\}}"
-    _after = rf"(?=\\section|\\chapter|{_end_doc}|\Z)"
-    patterns = [
-        rf"\\section\{{{section_name}\}}(.*?){_after}",
-        rf"\\section\{{.*?{section_name}.*?\}}(.*?){_after}",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-
-    return None
+    return _extract_heading(content, "section", section_name)
 
 
 def extract_subsection(content: str, subsection_name: str) -> Optional[str]:
@@ -46,18 +139,7 @@ def extract_subsection(content: str, subsection_name: str) -> Optional[str]:
     Returns:
         Subsection content or None if not found
     """
-    _after_sub = r"(?=\\subsection|\\section|\\chapter|\Z)"
-    patterns = [
-        rf"\\subsection\{{{subsection_name}\}}(.*?){_after_sub}",
-        rf"\\subsection\{{.*?{subsection_name}.*?\}}(.*?){_after_sub}",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-
-    return None
+    return _extract_heading(content, "subsection", subsection_name)
 
 
 def extract_environment(content: str, env_name: str) -> Optional[str]:
@@ -70,8 +152,7 @@ def extract_environment(content: str, env_name: str) -> Optional[str]:
     Returns:
         Environment content or None if not found
     """
-    pattern = rf"\\begin\{{{env_name}\}}(.*?)\\end\{{{env_name}\}}"
-    match = re.search(pattern, content, re.DOTALL)
+    match = _environment_pattern(env_name).search(content)
     return match.group(1).strip() if match else None
 
 
@@ -84,9 +165,23 @@ def extract_itemize_list(content: str) -> List[str]:
     Returns:
         List of item texts
     """
-    # Find all \item entries
-    items = re.findall(r"\\item\s+(.*?)(?=\\item|\\end)", content, re.DOTALL)
-    return [clean_latex(item.strip()) for item in items if item.strip()]
+    # Each \item (followed by whitespace, so not e.g. \itemsep) runs to the
+    # next \item or \end; a trailing item with neither is incomplete.
+    parts = content.split("\\item")
+    last = len(parts) - 1
+    items = []
+    for i, part in enumerate(parts[1:], 1):
+        if not part[:1].isspace():
+            continue
+        end = part.find("\\end")
+        if end >= 0:
+            part = part[:end]
+        elif i == last:
+            break
+        part = part.strip()
+        if part:
+            items.append(clean_latex(part))
+    return items
 
 
 def extract_first_paragraph(content: str, max_length: int = 500) -> str:
@@ -102,10 +197,18 @@ def extract_first_paragraph(content: str, max_length: int = 500) -> str:
     # Remove leading whitespace and commands
     content = content.lstrip()
 
-    # Find first paragraph (text before double newline or section)
-    match = re.search(r"^(.*?)(?:\n\n|\\section|\\subsection)", content, re.DOTALL)
-    if match:
-        paragraph = match.group(1)
+    # Find first paragraph (text before double newline or section). Look in
+    # a window a few times max_length first, so a distant marker does not
+    # cost a scan of the whole section; only without any end in the window
+    # is the rest searched (from just before the window edge, so a marker
+    # straddling it is still found).
+    window = min(len(content), max_length * 4 + 50)
+    end = _paragraph_end(content, 0, window)
+    if end < 0 and window < len(content):
+        resume = max(0, window - _LONGEST_PARAGRAPH_END + 1)
+        end = _paragraph_end(content, resume, len(content))
+    if end >= 0:
+        paragraph = content[:end]
     else:
         paragraph = content[:max_length]
 
@@ -118,6 +221,25 @@ def extract_first_paragraph(content: str, max_length: int = 500) -> str:
     return cleaned
 
 
+def _paragraph_end(content: str, start: int, stop: int) -> int:
+    """Return the earliest paragraph end in content[start:stop], or -1.
+
+    Each search stops at the earliest end found so far, so text past the
+    paragraph is never scanned twice.
+    """
+    end = stop
+    for marker in _PARAGRAPH_ENDS:
+        found = content.find(marker, start, end)
+        if found >= 0:
+            end = found
+    return end if end < stop else -1
+
+
+def _keep_argument(match: re.Match[str]) -> str:
+    """Return the kept argument of a _CLEAN_RE match, or '' to drop it."""
+    return match.group("fmt") or match.group("link") or ""
+
+
 def clean_latex(text: str) -> str:
     """Remove LaTeX commands and simplify text.
 
@@ -127,36 +249,22 @@ def clean_latex(text: str) -> str:
     Returns:
         Cleaned text with LaTeX commands removed
     """
-    # Remove citations
-    text = re.sub(r"\\cite\{[^}]+\}", "", text)
-    text = re.sub(r"\\citep?\{[^}]+\}", "", text)
-
-    # Remove references
-    text = re.sub(r"\\ref\{[^}]+\}", "", text)
-    text = re.sub(r"\\label\{[^}]+\}", "", text)
-
-    # Remove formatting commands (preserve content)
-    text = re.sub(r"\\textbf\{([^}]+)\}", r"\1", text)
-    text = re.sub(r"\\textit\{([^}]+)\}", r"\1", text)
-    text = re.sub(r"\\emph\{([^}]+)\}", r"\1", text)
-    text = re.sub(r"\\texttt\{([^}]+)\}", r"\1", text)
+    # Citations, references, formatting, URLs, comments and graphics. Repeat
+    # while something changed and commands remain, for nested commands and
+    # comments uncovered by unwrapping an argument.
+    count = 1
+    while count and ("\\" in text or "%" in text):
+        text, count = _CLEAN_RE.subn(_keep_argument, text)
 
-    # Remove URLs
-    text = re.sub(r"\\url\{[^}]+\}", "", text)
-    text = re.sub(r"\\href\{[^}]+\}\{([^}]+)\}", r"\1", text)
+    # Remove figure/table environments (DOTALL, so kept as separate passes);
+    # most inline snippets have no environment at all.
+    if "\\begin{" in text:
+        text = _FIGURE_RE.sub("", text)
+        text = _TABLE_RE.sub("", text)
 
-    # Remove comments
-    text = re.sub(r"%.*$", "", text, flags=re.MULTILINE)
-
-    # Remove figure/table references
-    text = re.sub(r"\\includegraphics.*?\{[^}]+\}", "", text)
-    text = re.sub(r"\\begin\{figure\}.*?\\end\{figure\}", "", text, flags=re.DOTALL)
-    text = re.sub(r"\\begin\{table\}.*?\\end\{table\}", "", text, flags=re.DOTALL)
-
-    # Clean whitespace
-    text = re.sub(r"\s+", " ", text).strip()
-
-    return text
+    # Collapse whitespace; str.split() uses the same Unicode whitespace
+    # definition as \s and avoids a regex match per gap.
+    return " ".join(text.split())
 
 
 def extract_chapter(content: str, chapter_name: str) -> Optional[str]:
@@ -169,16 +277,82 @@ def extract_chapter(content: str, chapter_name: str) -> Optional[str]:
     Returns:
         Chapter content or None if not found
     """
-    _end_doc_ch = r"\\end\{{document\}}"
-    _after_ch = rf"(?=\\chapter|{_end_doc_ch}|\Z)"
-    patterns = [
-        rf"\\chapter\{{{chapter_name}\}}(.*?){_after_ch}",
-        rf"\\chapter\{{.*?{chapter_name}.*?\}}(.*?){_after_ch}",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
+    return _extract_heading(content, "chapter", chapter_name)
 
-    return None
+
+class LatexIndex:
+    """Index of the section, subsection and chapter bodies of a document.
+
+    The document is tokenized once: exact titles are dictionary hits and
+    the title-substring fallback walks the recorded headings, so no lookup
+    rescans the document. Only offsets are kept; a body is sliced out of
+    the document when it is looked up. Bodies follow the same rules as
+    extract_section/extract_subsection/extract_chapter, and the first
+    heading with a given title wins.
+    """
+
+    __slots__ = ("content", "_spans", "_headings")
+
+    def __init__(self, content: str):
+        """Build the index.
+
+        Args:
+            content: Full LaTeX document content
+        """
+        self.content = content
+        self._spans: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        # (kind, lowercased title, body start, body end) in document order
+        self._headings: List[Tuple[str, str, int, int]] = []
+
+        # Walk tokens backwards so the next boundary of each kind is known
+        # when a heading is reached.
+        end = len(content)
+        next_boundary = {"section": end, "subsection": end, "chapter": end}
+        headings = self._headings
+        for match in reversed(list(_STRUCTURE_RE.finditer(content))):
+            kind = (match.group("kind") or "").lower()
+            title = match.group("title")
+            if kind and title is not None:
+                headings.append((kind, title.lower(), match.end(), next_boundary[kind]))
+
+            pos = match.start()
+            if kind == "section":
+                next_boundary["section"] = next_boundary["subsection"] = pos
+            elif kind == "subsection":
+                next_boundary["subsection"] = pos
+            elif kind == "chapter":
+                next_boundary.update(section=pos, subsection=pos, chapter=pos)
+            else:  # \end{document}
+                next_boundary["section"] = next_boundary["chapter"] = pos
+
+        headings.reverse()
+        for kind, title, start, stop in headings:
+            self._spans.setdefault((kind, title), (start, stop))
+
+    def _lookup(self, kind: str, name: str) -> Optional[str]:
+        needle = name.lower()
+        span = self._spans.get((kind, needle))
+        if span is None:
+            span = next(
+                (
+                    (start, stop)
+                    for heading_kind, title, start, stop in self._headings
+                    if heading_kind == kind and needle in title
+                ),
+                None,
+            )
+        if span is None:
+            return None
+        return self.content[span[0] : span[1]].strip()
+
+    def section(self, name: str) -> Optional[str]:
+        """Return the body of a section, like extract_section."""
+        return self._lookup("section", name)
+
+    def subsection(self, name: str) -> Optional[str]:
+        """Return the body of a subsection, like extract_subsection."""
+        return self._lookup("subsection", name)
+
+    def chapter(self, name: str) -> Optional[str]:
+        """Return the body of a chapter, like extract_chapter."""
+        return self._lookup("chapter", name)
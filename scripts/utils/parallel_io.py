@@ -3,40 +3,99 @@
 This module provides utilities for parallel file copying and processing.
 """
 
+import fnmatch
 import os
+import re
 import shutil
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
+_COPY_CHUNK = 1 << 30
 
-def copy_file_with_progress(src: str, dst: str) -> Tuple[str, bool]:
+# Files below this size are copied in batches of _SMALL_FILE_BATCH per worker
+# task, so per-task scheduling does not dominate trees of small .tex/.bib files.
+_SMALL_FILE_SIZE = 64 * 1024
+_SMALL_FILE_BATCH = 16
+
+
+def _copy_file(src: str, dst: str) -> None:
+    """Copy file data and metadata like shutil.copy2, in the kernel if possible.
+
+    os.copy_file_range (Linux) copies without moving data through user space
+    and can reflink on filesystems that support it. Anything it cannot handle
+    falls back to shutil.copyfile, which uses sendfile/fcopyfile itself.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    copied = False
+    if copy_file_range is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                size = os.fstat(fsrc.fileno()).st_size
+                total = 0
+                while True:
+                    n = copy_file_range(fsrc.fileno(), fdst.fileno(), _COPY_CHUNK)
+                    if not n:
+                        break
+                    total += n
+                # Some filesystems (FUSE, NFS, overlay, older cross-device
+                # kernels) report 0 without copying; treat a short copy as
+                # unsupported rather than leaving a truncated file.
+                copied = total >= size
+                if not copied:
+                    fdst.truncate(0)
+        except OSError:
+            pass
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def copy_file_with_progress(
+    src: str, dst: str, create_parent: bool = True
+) -> Tuple[str, bool]:
     """Copy a single file and return status.
 
     Args:
         src: Source file path
         dst: Destination file path
+        create_parent: Create the destination directory first; callers that
+            already created it can skip the extra syscalls
 
     Returns:
         Tuple of (filename, success)
     """
     try:
-        os.makedirs(os.path.dirname(dst), exist_ok=True)
-        shutil.copy2(src, dst)
+        if create_parent:
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+        _copy_file(src, dst)
         return (os.path.basename(src), True)
     except Exception as e:
         print(f"[WARNING] Failed to copy {os.path.basename(src)}: {e}")
         return (os.path.basename(src), False)
 
 
+def _copy_batch(pairs: List[Tuple[str, str]]) -> List[Tuple[str, bool]]:
+    """Copy several files, whose parents exist, in one worker task."""
+    return [copy_file_with_progress(src, dst, False) for src, dst in pairs]
+
+
+def _is_small_file(path: str) -> bool:
+    try:
+        return os.stat(path).st_size < _SMALL_FILE_SIZE
+    except OSError:
+        return False
+
+
 def copy_files_parallel(
-    file_pairs: List[Tuple[str, str]],
+    file_pairs: Iterable[Tuple[str, str]],
     max_workers: Optional[int] = None,
     progress_callback: Optional[Callable] = None,
 ) -> int:
     """Copy multiple files in parallel.
 
     Args:
-        file_pairs: List of (source, destination) tuples
+        file_pairs: Iterable of (source, destination) tuples; copies start
+            while a generator is still producing pairs
         max_workers: Maximum number of worker threads (default: CPU count)
         progress_callback: Optional callback function called after each file
 
@@ -50,28 +109,110 @@ def copy_files_parallel(
         ]
         count = copy_files_parallel(files)
     """
-    if not file_pairs:
-        return 0
-
     success_count = 0
 
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(copy_file_with_progress, src, dst): (src, dst)
-            for src, dst in file_pairs
-        }
+        futures = []
+        batch: List[Tuple[str, str]] = []
+        # Parent directories are created once here, not per file by workers.
+        # A failure is left for the copy itself to report.
+        created_dirs = set()
+        for src, dst in file_pairs:
+            parent = os.path.dirname(dst)
+            if parent not in created_dirs:
+                try:
+                    os.makedirs(parent, exist_ok=True)
+                    created_dirs.add(parent)
+                except OSError:
+                    pass
+            if not _is_small_file(src):
+                futures.append(executor.submit(_copy_batch, [(src, dst)]))
+                continue
+            batch.append((src, dst))
+            if len(batch) == _SMALL_FILE_BATCH:
+                futures.append(executor.submit(_copy_batch, batch))
+                batch = []
+        if batch:
+            futures.append(executor.submit(_copy_batch, batch))
 
         for future in as_completed(futures):
-            filename, success = future.result()
-            if success:
-                success_count += 1
+            for filename, success in future.result():
+                if success:
+                    success_count += 1
 
-            if progress_callback:
-                progress_callback(filename, success)
+                if progress_callback:
+                    progress_callback(filename, success)
 
     return success_count
 
 
+def _compile_excludes(
+    patterns: List[str],
+) -> Tuple[Optional[re.Pattern[str]], Optional[re.Pattern[str]]]:
+    """Compile exclude patterns into file and directory name matchers.
+
+    Patterns containing *, ? or [ are globs matched against the whole name.
+    Other patterns exclude files whose name contains them, and directories
+    named exactly like them (e.g. '.git', '__pycache__').
+
+    Returns:
+        (file matcher, directory matcher); either is None when unused
+    """
+    globs = [fnmatch.translate(p) for p in patterns if any(c in p for c in "*?[")]
+    plain = [re.escape(p) for p in patterns if not any(c in p for c in "*?[")]
+
+    # Both matchers are used with .match(); fnmatch.translate ends in \Z.
+    file_alts = globs + [rf"(?s:.*?(?:{'|'.join(plain)}))"] if plain else globs
+    dir_alts = globs + [rf"(?:{'|'.join(plain)})\Z"] if plain else globs
+    if not file_alts:
+        return None, None
+    return re.compile("|".join(file_alts)), re.compile("|".join(dir_alts))
+
+
+def _scan_files(
+    top: str, prefix: str = "", prune: Optional[re.Pattern[str]] = None
+) -> Iterator[Tuple[str, os.DirEntry[str]]]:
+    """Yield (relative path, entry) for each file below top.
+
+    The relative path is built once per directory and extended by each
+    entry's name, rather than recomputed with os.path.relpath per file.
+
+    Like os.walk, symlinks to directories are not descended into. Directories
+    whose name matches prune are skipped entirely.
+    """
+    with os.scandir(top) as it:
+        for entry in it:
+            rel = prefix + entry.name
+            if not entry.is_dir():
+                yield rel, entry
+            elif not entry.is_symlink() and not (prune and prune.match(entry.name)):
+                yield from _scan_files(entry.path, rel + os.sep, prune)
+
+
+def iter_files_to_copy(
+    src_dir: str, dst_dir: str, exclude_patterns: Optional[List[str]] = None
+) -> Iterator[Tuple[str, str]]:
+    """Yield files to copy from source to destination as they are found.
+
+    Args:
+        src_dir: Source directory
+        dst_dir: Destination directory
+        exclude_patterns: Optional list of patterns to exclude; glob patterns
+            match whole names, others match as substrings of file names and
+            as exact directory names
+
+    Yields:
+        (source, destination) file pairs
+    """
+    excluded_file, excluded_dir = _compile_excludes(exclude_patterns or [])
+    dst_prefix = os.path.join(dst_dir, "")
+
+    for rel, entry in _scan_files(src_dir, prune=excluded_dir):
+        if excluded_file and excluded_file.match(entry.name):
+            continue
+        yield entry.path, dst_prefix + rel
+
+
 def get_files_to_copy(
     src_dir: str, dst_dir: str, exclude_patterns: Optional[List[str]] = None
 ) -> List[Tuple[str, str]]:
@@ -85,26 +226,7 @@ def get_files_to_copy(
     Returns:
         List of (source, destination) file pairs
     """
-    file_pairs = []
-    exclude_patterns = exclude_patterns or []
-
-    for root, _, files in os.walk(src_dir):
-        rel_path = os.path.relpath(root, src_dir)
-
-        for file in files:
-            if any(pattern in file for pattern in exclude_patterns):
-                continue
-
-            src_file = os.path.join(root, file)
-
-            if rel_path == ".":
-                dst_file = os.path.join(dst_dir, file)
-            else:
-                dst_file = os.path.join(dst_dir, rel_path, file)
-
-            file_pairs.append((src_file, dst_file))
-
-    return file_pairs
+    return list(iter_files_to_copy(src_dir, dst_dir, exclude_patterns))
 
 
 def copy_directory_parallel(
@@ -133,5 +255,5 @@ def copy_directory_parallel(
             exclude_patterns=['.git', '__pycache__']
         )
     """
-    file_pairs = get_files_to_copy(src_dir, dst_dir, exclude_patterns)
+    file_pairs = iter_files_to_copy(src_dir, dst_dir, exclude_patterns)
     return copy_files_parallel(file_pairs, max_workers, progress_callback)
@@ -4,13 +4,47 @@ This module provides caching and optimization utilities for improved performance
 """
 
 import functools
+import os
 import time
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Optional
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import BytecodeCache, Environment, FileSystemLoader
 
 _template_env_cache: Dict[str, Environment] = {}
 
+_MEMOIZE_MAXSIZE = 128
+
+# Overrides where compiled template bytecode is stored between runs.
+JINJA_CACHE_DIR_ENV = "IITJ_JINJA_CACHE_DIR"
+
+# Profiling is opt-in: set IITJ_PROFILE=1 to record operation timings.
+# Otherwise profiler calls return immediately and profile_operation leaves
+# functions unwrapped.
+PROFILING_ENABLED = os.environ.get("IITJ_PROFILE", "0") not in ("", "0")
+
+
+def get_bytecode_cache() -> Optional[BytecodeCache]:
+    """Return an on-disk cache for compiled template bytecode.
+
+    Uses the directory named by IITJ_JINJA_CACHE_DIR if set, otherwise
+    Jinja2's private per-user directory under the system temp dir. Entries
+    are checked against the template source, so edited templates are
+    recompiled.
+
+    Returns:
+        Bytecode cache, or None if no usable cache directory exists
+    """
+    from jinja2 import FileSystemBytecodeCache
+
+    cache_dir = os.environ.get(JINJA_CACHE_DIR_ENV)
+    try:
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            return FileSystemBytecodeCache(cache_dir)
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
 
 def get_cached_template_environment(template_dir: str) -> Environment:
     """Get or create a cached Jinja2 environment.
@@ -33,6 +67,7 @@ def get_cached_template_environment(template_dir: str) -> Environment:
             trim_blocks=True,
             lstrip_blocks=True,
             keep_trailing_newline=True,
+            bytecode_cache=get_bytecode_cache(),
         )
     return _template_env_cache[template_dir]
 
@@ -45,6 +80,10 @@ def clear_template_cache() -> None:
 def memoize(func: Callable[..., Any]) -> Callable[..., Any]:
     """Memoization decorator for caching function results.
 
+    Backed by functools.lru_cache, so arguments are hashed directly and the
+    cache keeps at most _MEMOIZE_MAXSIZE results. Calls with unhashable
+    arguments (lists, dicts) bypass the cache and run the function.
+
     Args:
         func: Function to memoize
 
@@ -57,15 +96,18 @@ def memoize(func: Callable[..., Any]) -> Callable[..., Any]:
             # Expensive computation
             return result
     """
-    cache: Dict[str, Any] = {}
+    cached = functools.lru_cache(maxsize=_MEMOIZE_MAXSIZE)(func)
 
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        key = str(args) + str(sorted(kwargs.items()))
-        if key not in cache:
-            cache[key] = func(*args, **kwargs)
-        return cache[key]
-
+        try:
+            hash((args, tuple(kwargs.values())))
+        except TypeError:
+            return func(*args, **kwargs)
+        return cached(*args, **kwargs)
+
+    wrapper.cache_info = cached.cache_info  # type: ignore[attr-defined]
+    wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
     return wrapper
 
 
@@ -87,10 +129,10 @@ def timed(func: Callable[..., Any]) -> Callable[..., Any]:
 
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        print(f"[TIMER] {func.__name__} took {end_time - start_time:.3f}s")
+        elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+        print(f"[TIMER] {func.__name__} took {elapsed:.3f}s")
         return result
 
     return wrapper
@@ -101,16 +143,24 @@ class PerformanceProfiler:
 
     def __init__(self) -> None:
         """Initialize profiler."""
-        self.timings: Dict[str, float] = {}
+        self._starts: Dict[str, int] = {}
+        self.totals: Dict[str, int] = {}
         self.counts: Dict[str, int] = {}
 
+    @property
+    def timings(self) -> Dict[str, float]:
+        """Total time per completed operation, in seconds."""
+        return {op: total / 1e9 for op, total in self.totals.items()}
+
     def start(self, operation: str) -> None:
         """Start timing an operation.
 
         Args:
             operation: Name of the operation
         """
-        self.timings[f"{operation}_start"] = time.time()
+        if not PROFILING_ENABLED:
+            return
+        self._starts[operation] = time.perf_counter_ns()
 
     def end(self, operation: str) -> None:
         """End timing an operation.
@@ -118,34 +168,24 @@ class PerformanceProfiler:
         Args:
             operation: Name of the operation
         """
-        start_key = f"{operation}_start"
-        if start_key in self.timings:
-            elapsed = time.time() - self.timings[start_key]
-
-            if operation not in self.timings:
-                self.timings[operation] = 0
-                self.counts[operation] = 0
-
-            self.timings[operation] += elapsed
-            self.counts[operation] += 1
-            del self.timings[start_key]
+        if not PROFILING_ENABLED:
+            return
+        start_ns = self._starts.pop(operation, None)
+        if start_ns is None:
+            return
+        elapsed = time.perf_counter_ns() - start_ns
+        self.totals[operation] = self.totals.get(operation, 0) + elapsed
+        self.counts[operation] = self.counts.get(operation, 0) + 1
 
     def report(self) -> None:
         """Print performance report."""
         print("\nPerformance Report")
         print("=" * 60)
 
-        sorted_ops = sorted(
-            [
-                (op, time_val)
-                for op, time_val in self.timings.items()
-                if not op.endswith("_start")
-            ],
-            key=lambda x: x[1],
-            reverse=True,
-        )
+        sorted_ops = sorted(self.totals.items(), key=lambda x: x[1], reverse=True)
 
-        for operation, total_time in sorted_ops:
+        for operation, total_ns in sorted_ops:
+            total_time = total_ns / 1e9
             count = self.counts.get(operation, 1)
             avg_time = total_time / count
             print(
@@ -157,7 +197,8 @@ class PerformanceProfiler:
 
     def reset(self) -> None:
         """Reset profiler statistics."""
-        self.timings.clear()
+        self._starts.clear()
+        self.totals.clear()
         self.counts.clear()
 
 
@@ -178,6 +219,9 @@ def profile_operation(
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """Decorator to profile an operation.
 
+    Only takes effect when IITJ_PROFILE is set at decoration time; otherwise
+    the function is returned unchanged.
+
     Args:
         operation: Name of the operation to profile
 
@@ -189,6 +233,9 @@ def profile_operation(
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if not PROFILING_ENABLED:
+            return func
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             profiler = get_profiler()
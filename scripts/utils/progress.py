@@ -5,13 +5,31 @@ This module provides progress indicators for long-running operations.
 
 import functools
 import sys
+import threading
 import time
 from contextlib import contextmanager
 from typing import Any, Callable, Generator, Optional
 
+# Serializes terminal writes so spinner frames and progress bars from
+# different threads do not interleave.
+_output_lock = threading.Lock()
+
+
+def _stdout_is_tty() -> bool:
+    """Return True if stdout is an interactive terminal."""
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty())
+
 
 class ProgressBar:
-    """Simple progress bar for terminal output."""
+    """Simple progress bar for terminal output.
+
+    When stdout is not a terminal (CI logs, pipes), only the completed bar
+    is written instead of a stream of carriage-return repaints.
+    """
+
+    # Repaint at most ~30 times a second; the final step always repaints.
+    PAINT_INTERVAL_NS = 33_000_000
 
     def __init__(self, total: int, description: str = "", width: int = 40):
         """Initialize progress bar.
@@ -25,7 +43,14 @@ class ProgressBar:
         self.current = 0
         self.description = description
         self.width = width
-        self.start_time = time.time()
+        self.start_ns = time.perf_counter_ns()
+        self._last_paint_ns: Optional[int] = None
+        self._bar_filled = -1
+        self._bar_str = ""
+        self._interactive = _stdout_is_tty()
+        # Every bar is a slice of these two, so repaints never rebuild them.
+        self._full = "█" * width
+        self._empty = "░" * width
 
     def update(self, step: int = 1) -> None:
         """Update progress by specified steps."""
@@ -36,12 +61,26 @@ class ProgressBar:
         """Display the progress bar."""
         if self.total == 0:
             return
+        if not self._interactive and self.current < self.total:
+            return
+
+        now = time.perf_counter_ns()
+        if (
+            self._last_paint_ns is not None
+            and now - self._last_paint_ns < self.PAINT_INTERVAL_NS
+            and self.current < self.total
+        ):
+            return
+        self._last_paint_ns = now
 
         percent = self.current / self.total
         filled = int(self.width * percent)
-        bar_str = "█" * filled + "░" * (self.width - filled)
+        if filled != self._bar_filled:
+            self._bar_filled = filled
+            self._bar_str = self._full[:filled] + self._empty[filled:]
+        bar_str = self._bar_str
 
-        elapsed = time.time() - self.start_time
+        elapsed = (now - self.start_ns) / 1e9
         if self.current > 0:
             eta = (elapsed / self.current) * (self.total - self.current)
             eta_str = f"ETA: {int(eta)}s"
@@ -49,11 +88,10 @@ class ProgressBar:
             eta_str = "ETA: --"
 
         output = f"\r{self.description} [{bar_str}] {int(percent * 100)}% ({self.current}/{self.total}) {eta_str}"  # noqa: E501
-        sys.stdout.write(output)
-        sys.stdout.flush()
-
         if self.current >= self.total:
-            sys.stdout.write("\n")
+            output += "\n"
+        with _output_lock:
+            sys.stdout.write(output)
             sys.stdout.flush()
 
     def finish(self) -> None:
@@ -63,9 +101,14 @@ class ProgressBar:
 
 
 class Spinner:
-    """Simple spinner for indeterminate operations."""
+    """Simple spinner for indeterminate operations.
+
+    Once started, frames are advanced by a daemon thread until stop(),
+    which wakes the thread immediately rather than waiting out a frame.
+    """
 
     FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+    INTERVAL = 0.1
 
     def __init__(self, description: str = ""):
         """Initialize spinner.
@@ -76,11 +119,21 @@ class Spinner:
         self.description = description
         self.frame_index = 0
         self.running = False
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
 
     def start(self) -> None:
         """Start the spinner."""
         self.running = True
+        self._stop_event.clear()
         self._display()
+        self._thread = threading.Thread(target=self._spin, daemon=True)
+        self._thread.start()
+
+    def _spin(self) -> None:
+        """Advance frames until the spinner is stopped."""
+        while not self._stop_event.wait(self.INTERVAL):
+            self._display()
 
     def stop(self, final_message: Optional[str] = None) -> None:
         """Stop the spinner.
@@ -89,20 +142,26 @@ class Spinner:
             final_message: Optional message to display when stopping
         """
         self.running = False
-        sys.stdout.write("\r" + " " * 80 + "\r")
-        if final_message:
-            print(final_message)
-        sys.stdout.flush()
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with _output_lock:
+            sys.stdout.write("\r" + " " * 80 + "\r")
+            if final_message:
+                print(final_message)
+            sys.stdout.flush()
 
     def _display(self) -> None:
         """Display the spinner frame."""
-        if not self.running:
-            return
+        with _output_lock:
+            if not self.running:
+                return
 
-        frame = self.FRAMES[self.frame_index % len(self.FRAMES)]
-        sys.stdout.write(f"\r{frame} {self.description}")
-        sys.stdout.flush()
-        self.frame_index += 1
+            frame = self.FRAMES[self.frame_index % len(self.FRAMES)]
+            sys.stdout.write(f"\r{frame} {self.description}")
+            sys.stdout.flush()
+            self.frame_index += 1
 
 
 @contextmanager
@@ -161,6 +220,8 @@ def with_progress(
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """Decorator for functions that should show progress.
 
+    The spinner is shown only when stdout is a terminal.
+
     Args:
         description: Description of the operation
 
@@ -174,7 +235,12 @@ def with_progress(
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            with spinner_context(description):
+            # Spinner frames only make sense on a terminal; in CI logs and
+            # pipes just run the function and report completion.
+            if _stdout_is_tty():
+                with spinner_context(description):
+                    result = func(*args, **kwargs)
+            else:
                 result = func(*args, **kwargs)
             print(f"[OK] {description} complete")
             return result
@@ -5,14 +5,40 @@ This module handles LaTeX template rendering with Jinja2.
 
 import os
 import re
-from typing import Any, Dict
+from typing import Any, Dict, Set
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
+# Single-character LaTeX escapes, applied in one pass with str.translate.
+_LATEX_ESCAPES = str.maketrans(
+    {
+        "\\": r"\textbackslash{}",
+        "{": r"\{",
+        "}": r"\}",
+        "&": r"\&",
+        "%": r"\%",
+        "$": r"\$",
+        "#": r"\#",
+        "_": r"\_",
+        "~": r"\textasciitilde{}",
+        "^": r"\textasciicircum{}",
+    }
+)
+_LATEX_SPECIAL = re.compile(r"[\\{}&%$#_~^]")
+
+# Environments built here when the shared performance cache is unavailable.
+_fallback_env_cache: Dict[str, Environment] = {}
+
+# Output directories render_template has already created in this process.
+_created_dirs: Set[str] = set()
+
 
 def get_template_environment(template_dir: str) -> Environment:
     """Create Jinja2 environment for template rendering.
 
+    Environments are built once per template directory and reused, so
+    compiled templates survive across render_template calls.
+
     Args:
         template_dir: Path to template directory
 
@@ -22,32 +48,39 @@ def get_template_environment(template_dir: str) -> Environment:
     try:
         from .performance import get_cached_template_environment
 
-        return get_cached_template_environment(template_dir)
+        env = get_cached_template_environment(template_dir)
     except (ImportError, AttributeError):
-        env = Environment(
-            loader=FileSystemLoader(template_dir),
-            autoescape=select_autoescape(["html", "xml"]),
-            block_start_string="\\BLOCK{",
-            block_end_string="}",
-            variable_start_string="\\VAR{",
-            variable_end_string="}",
-            comment_start_string="\\#{",
-            comment_end_string="}",
-            line_statement_prefix="%%",
-            line_comment_prefix="%#",
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-        env.filters["latex_escape"] = latex_escape
-        return env
+        if template_dir not in _fallback_env_cache:
+            _fallback_env_cache[template_dir] = _build_environment(template_dir)
+        env = _fallback_env_cache[template_dir]
+    env.filters.setdefault("latex_escape", latex_escape)
+    return env
+
+
+def _build_environment(template_dir: str) -> Environment:
+    """Build the LaTeX-delimited environment used without the shared cache."""
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=select_autoescape(["html", "xml"]),
+        block_start_string="\\BLOCK{",
+        block_end_string="}",
+        variable_start_string="\\VAR{",
+        variable_end_string="}",
+        comment_start_string="\\#{",
+        comment_end_string="}",
+        line_statement_prefix="%%",
+        line_comment_prefix="%#",
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
 
 
 def latex_escape(text: str) -> str:
     """Escape special LaTeX characters in a single pass to avoid corruption.
 
-    Uses a regex substitution so that no replacement string is re-scanned,
-    which prevents sequences like \\textbackslash{} from having their braces
-    re-escaped on a second pass.
+    Uses str.translate, which maps each input character exactly once, so no
+    replacement string is re-scanned and sequences like \\textbackslash{}
+    never have their braces re-escaped.
 
     Args:
         text: Text to escape
@@ -55,22 +88,11 @@ def latex_escape(text: str) -> str:
     Returns:
         Escaped text safe for LaTeX
     """
-    if not isinstance(text, str):
+    # Most fields (names, titles) have nothing to escape; skip the copy.
+    if not isinstance(text, str) or not _LATEX_SPECIAL.search(text):
         return text
 
-    _latex_escape_map = {
-        "\\": r"\textbackslash{}",
-        "{": r"\{",
-        "}": r"\}",
-        "&": r"\&",
-        "%": r"\%",
-        "$": r"\$",
-        "#": r"\#",
-        "_": r"\_",
-        "~": r"\textasciitilde{}",
-        "^": r"\textasciicircum{}",
-    }
-    return re.sub(r"[\\{}&%$#_~^]", lambda m: _latex_escape_map[m.group()], text)
+    return text.translate(_LATEX_ESCAPES)
 
 
 def render_template(
@@ -88,11 +110,23 @@ def render_template(
 
     env = get_template_environment(template_dir)
     template = env.get_template(template_name)
-    rendered = template.render(**context)
 
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(rendered)
+    output_dir = os.path.dirname(output_path)
+    if output_dir and output_dir not in _created_dirs:
+        os.makedirs(output_dir, exist_ok=True)
+        _created_dirs.add(output_dir)
+
+    try:
+        f = open(output_path, "w", encoding="utf-8")
+    except FileNotFoundError:
+        # The directory was removed after it was cached; recreate and retry.
+        os.makedirs(output_dir, exist_ok=True)
+        f = open(output_path, "w", encoding="utf-8")
+
+    # Stream chunks straight to disk instead of building the whole document.
+    # Text mode keeps the platform newline translation.
+    with f:
+        f.writelines(template.generate(**context))
 
 
 def prepare_context(config: Dict[str, Any]) -> Dict[str, Any]:
@@ -104,65 +138,59 @@ def prepare_context(config: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Context dictionary for template rendering
     """
+    # Bind each section once; a missing or null section reads as empty.
+    project = config.get("project") or {}
+    author = config.get("author") or {}
+    academic = config.get("academic") or {}
+    dates = config.get("dates") or {}
+    formatting = config.get("formatting") or {}
+    content = config.get("content") or {}
+    assets = config.get("assets") or {}
+    presentation = config.get("presentation") or {}
+
+    department = academic.get("department", "")
+    submission_date = dates.get("submission_date", "")
+    aspect_ratio = presentation.get("aspect_ratio", "16:9")
+
     context = {
         # Project info
-        "TITLE": config.get("project", {}).get("title", ""),
-        "PROJECT_TYPE": config.get("project", {}).get("type", ""),
+        "TITLE": project.get("title", ""),
+        "PROJECT_TYPE": project.get("type", ""),
         # Author info
-        "AUTHOR_NAME": config.get("author", {}).get("name", ""),
-        "ROLL_NUMBER": config.get("author", {}).get("roll_number", ""),
-        "EMAIL": config.get("author", {}).get("email", ""),
+        "AUTHOR_NAME": author.get("name", ""),
+        "ROLL_NUMBER": author.get("roll_number", ""),
+        "EMAIL": author.get("email", ""),
         # Academic info
-        "SUPERVISOR": config.get("academic", {}).get("supervisor", ""),
-        "CO_SUPERVISOR": config.get("academic", {}).get("co_supervisor", ""),
-        "SUPERVISOR_DESIGNATION": config.get("academic", {}).get(
-            "supervisor_designation", "Professor"
-        ),
-        "SUPERVISOR_DEPARTMENT": config.get("academic", {}).get(
-            "supervisor_department", config.get("academic", {}).get("department", "")
-        ),
-        "DEPARTMENT": config.get("academic", {}).get("department", ""),
-        "UNIVERSITY": config.get("academic", {}).get("university", ""),
-        "DEGREE": config.get("academic", {}).get("degree", ""),
-        "SESSION": config.get("academic", {}).get("session", ""),
+        "SUPERVISOR": academic.get("supervisor", ""),
+        "CO_SUPERVISOR": academic.get("co_supervisor", ""),
+        "SUPERVISOR_DESIGNATION": academic.get("supervisor_designation", "Professor"),
+        "SUPERVISOR_DEPARTMENT": academic.get("supervisor_department", department),
+        "DEPARTMENT": department,
+        "UNIVERSITY": academic.get("university", ""),
+        "DEGREE": academic.get("degree", ""),
+        "SESSION": academic.get("session", ""),
         # Dates
-        "SUBMISSION_DATE": config.get("dates", {}).get("submission_date", ""),
+        "SUBMISSION_DATE": submission_date,
         # Formatting
-        "COLOR_SCHEME": config.get("formatting", {}).get("color_scheme", "blue"),
-        "FONT_SIZE": config.get("formatting", {}).get("font_size", 12),
-        "LINE_SPACING": config.get("formatting", {}).get("line_spacing", 1.5),
-        "BIBLIOGRAPHY_STYLE": config.get("formatting", {}).get(
-            "bibliography_style", "IEEE"
-        ),
+        "COLOR_SCHEME": formatting.get("color_scheme", "blue"),
+        "FONT_SIZE": formatting.get("font_size", 12),
+        "LINE_SPACING": formatting.get("line_spacing", 1.5),
+        "BIBLIOGRAPHY_STYLE": formatting.get("bibliography_style", "IEEE"),
         # Content options
-        "INCLUDE_DECLARATION": config.get("content", {}).get(
-            "include_declaration", True
-        ),
-        "INCLUDE_CERTIFICATE": config.get("content", {}).get(
-            "include_certificate", True
-        ),
-        "INCLUDE_ACKNOWLEDGMENTS": config.get("content", {}).get(
-            "include_acknowledgments", True
-        ),
-        "INCLUDE_ABSTRACT": config.get("content", {}).get("include_abstract", True),
-        "INCLUDE_APPENDIX": config.get("content", {}).get("include_appendix", False),
-        "INCLUDE_GLOSSARY": config.get("content", {}).get("include_glossary", False),
+        "INCLUDE_DECLARATION": content.get("include_declaration", True),
+        "INCLUDE_CERTIFICATE": content.get("include_certificate", True),
+        "INCLUDE_ACKNOWLEDGMENTS": content.get("include_acknowledgments", True),
+        "INCLUDE_ABSTRACT": content.get("include_abstract", True),
+        "INCLUDE_APPENDIX": content.get("include_appendix", False),
+        "INCLUDE_GLOSSARY": content.get("include_glossary", False),
         # Assets
-        "LOGO_PATH": config.get("assets", {}).get("logo_path", "logo.png"),
+        "LOGO_PATH": assets.get("logo_path", "logo.png"),
         # Presentation-specific
-        "THEME": config.get("presentation", {}).get("theme", "Madrid"),
-        "PRESENTATION_COLOR_SCHEME": config.get("presentation", {}).get(
-            "color_scheme", "default"
-        ),
-        "ASPECT_RATIO": config.get("presentation", {}).get("aspect_ratio", "16:9"),
-        "ASPECT_RATIO_VALUE": (
-            "169"
-            if config.get("presentation", {}).get("aspect_ratio", "16:9") == "16:9"
-            else "43"
-        ),
-        "PRESENTATION_DATE": config.get("presentation", {}).get(
-            "presentation_date", config.get("dates", {}).get("submission_date", "")
-        ),
+        "THEME": presentation.get("theme", "Madrid"),
+        "PRESENTATION_COLOR_SCHEME": presentation.get("color_scheme", "default"),
+        "ASPECT_RATIO": aspect_ratio,
+        "ASPECT_RATIO_VALUE": "169" if aspect_ratio == "16:9" else "43",
+        "PRESENTATION_DATE": presentation.get("presentation_date", submission_date),
     }
 
     if "extracted_content" in config:
@@ -2,7 +2,43 @@
 
 import os
 import re
-from typing import Dict, List
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Same table as template_engine.latex_escape, kept local so validation does
+# not import Jinja2.
+_LATEX_ESCAPES = str.maketrans(
+    {
+        "\\": r"\textbackslash{}",
+        "{": r"\{",
+        "}": r"\}",
+        "&": r"\&",
+        "%": r"\%",
+        "$": r"\$",
+        "#": r"\#",
+        "_": r"\_",
+        "~": r"\textasciitilde{}",
+        "^": r"\textasciicircum{}",
+    }
+)
+_LATEX_SPECIAL = re.compile(r"[\\{}&%$#_~^]")
+
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_DATE_RE = re.compile(r"^[A-Z][a-z]+\s+\d{4}$")
+
+# Fields validate_config requires, with their key paths split once.
+_REQUIRED_FIELDS = (
+    "project.title",
+    "project.type",
+    "author.name",
+    "author.roll_number",
+    "academic.supervisor",
+    "academic.department",
+    "academic.university",
+    "academic.degree",
+)
+_REQUIRED_PATHS = tuple((field, tuple(field.split("."))) for field in _REQUIRED_FIELDS)
+
+_VALID_TYPES = ("proposal", "major-project", "presentation")
 
 
 def validate_email(email: str) -> bool:
@@ -14,8 +50,7 @@ def validate_email(email: str) -> bool:
     Returns:
         True if email is valid, False otherwise
     """
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    return _EMAIL_RE.match(email) is not None
 
 
 def validate_required_fields(data: Dict, required_fields: List[str]) -> List[str]:
@@ -28,26 +63,32 @@ def validate_required_fields(data: Dict, required_fields: List[str]) -> List[str
     Returns:
         List of missing field names
     """
+    return _missing_fields(
+        data, [(field, tuple(field.split("."))) for field in required_fields]
+    )
+
+
+def _missing_fields(
+    data: Dict, required_paths: Sequence[Tuple[str, Tuple[str, ...]]]
+) -> List[str]:
+    """Return the fields whose pre-split key path is absent or empty in data."""
     missing = []
-    for field in required_fields:
-        if "." in field:
-            parts = field.split(".")
-            current = data
-            for part in parts:
-                if (
-                    not isinstance(current, dict)
-                    or part not in current
-                    or not current[part]
-                ):
-                    missing.append(field)
-                    break
-                current = current[part]
-        else:
-            if field not in data or not data[field]:
+    for field, path in required_paths:
+        current: Any = data
+        for part in path:
+            current = current.get(part) if isinstance(current, dict) else None
+            if not current:
                 missing.append(field)
+                break
     return missing
 
 
+def _section(config: Dict, key: str) -> Dict:
+    """Return config[key] if it is a mapping, else an empty dict."""
+    value = config.get(key)
+    return value if isinstance(value, dict) else {}
+
+
 def validate_file_path(path: str) -> bool:
     """Validate that a file path exists.
 
@@ -69,16 +110,14 @@ def validate_date_format(date_str: str) -> bool:
     Returns:
         True if format is valid, False otherwise
     """
-    pattern = r"^[A-Z][a-z]+\s+\d{4}$"
-    return bool(re.match(pattern, date_str))
+    return _DATE_RE.match(date_str) is not None
 
 
 def sanitize_latex(text: str) -> str:
     """Escape special LaTeX characters in a single pass to avoid corruption.
 
-    Uses a regex substitution so that no replacement string is re-scanned,
-    which prevents sequences like \\textbackslash{} from having their braces
-    re-escaped on a second pass.
+    Each character is translated once, so the braces of an inserted
+    \\textbackslash{} are never escaped again.
 
     Args:
         text: Text to sanitize
@@ -86,19 +125,9 @@ def sanitize_latex(text: str) -> str:
     Returns:
         Sanitized text safe for LaTeX
     """
-    _latex_escape_map = {
-        "\\": r"\textbackslash{}",
-        "{": r"\{",
-        "}": r"\}",
-        "&": r"\&",
-        "%": r"\%",
-        "$": r"\$",
-        "#": r"\#",
-        "_": r"\_",
-        "~": r"\textasciitilde{}",
-        "^": r"\textasciicircum{}",
-    }
-    return re.sub(r"[\\{}&%$#_~^]", lambda m: _latex_escape_map[m.group()], text)
+    if not _LATEX_SPECIAL.search(text):
+        return text
+    return text.translate(_LATEX_ESCAPES)
 
 
 def validate_config(config: Dict) -> tuple[bool, List[str]]:
@@ -112,39 +141,27 @@ def validate_config(config: Dict) -> tuple[bool, List[str]]:
     """
     errors = []
 
-    required = [
-        "project.title",
-        "project.type",
-        "author.name",
-        "author.roll_number",
-        "academic.supervisor",
-        "academic.department",
-        "academic.university",
-        "academic.degree",
-    ]
-
-    missing = validate_required_fields(config, required)
+    missing = _missing_fields(config, _REQUIRED_PATHS)
     if missing:
         errors.append(f"Missing required fields: {', '.join(missing)}")
 
-    if "author" in config and "email" in config["author"] and config["author"]["email"]:
-        if not validate_email(config["author"]["email"]):
-            errors.append(f"Invalid email format: {config['author']['email']}")
+    project = _section(config, "project")
+    author = _section(config, "author")
+    assets = _section(config, "assets")
+
+    email = author.get("email")
+    if email and not validate_email(email):
+        errors.append(f"Invalid email format: {email}")
 
-    if "project" in config and "type" in config["project"]:
-        valid_types = ["proposal", "major-project", "presentation"]
-        if config["project"]["type"] not in valid_types:
-            ptype = config["project"]["type"]
+    if "type" in project:
+        ptype = project["type"]
+        if ptype not in _VALID_TYPES:
             errors.append(
-                f"Invalid project type: {ptype}. Must be one of {valid_types}"
+                f"Invalid project type: {ptype}. Must be one of {list(_VALID_TYPES)}"
             )
 
-    if (
-        "assets" in config
-        and "logo_path" in config["assets"]
-        and config["assets"]["logo_path"]
-    ):
-        if not validate_file_path(config["assets"]["logo_path"]):
-            errors.append(f"Logo file not found: {config['assets']['logo_path']}")
+    logo_path = assets.get("logo_path")
+    if logo_path and not validate_file_path(logo_path):
+        errors.append(f"Logo file not found: {logo_path}")
 
     return len(errors) == 0, errors
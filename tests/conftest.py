@@ -0,0 +1,14 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture
+def assert_all_in():
+    """Return a checker that reports every expected substring missing from a text."""
+
+    def check(text, needles):
+        missing = [needle for needle in needles if needle not in text]
+        assert not missing, f"missing from output: {missing}"
+
+    return check
@@ -3,16 +3,18 @@
 import pytest
 import os
 import tempfile
-from scripts.utils.content_extractor import ContentExtractor, extract_content_from_report
-
-
-class TestContentExtractor:
-    """Tests for ContentExtractor class."""
-    
-    @pytest.fixture
-    def sample_report(self):
-        """Create a sample LaTeX report for testing."""
-        content = r"""
+from unittest.mock import patch
+from scripts.utils.content_extractor import (
+    ContentExtractor,
+    extract_content_from_report,
+    extract_content_from_reports,
+)
+
+
+@pytest.fixture(scope="class")
+def sample_report():
+    """Create a sample LaTeX report, written once and shared by the class."""
+    content = r"""
 \documentclass{article}
 \begin{document}
 
@@ -66,16 +68,20 @@ In conclusion, this work was successful.
 
 \end{document}
 """
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.tex', delete=False, encoding='utf-8') as f:
-            f.write(content)
-            temp_path = f.name
-        
-        yield temp_path
-        
-        # Cleanup
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
+    # Create temporary file
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.tex', delete=False, encoding='utf-8') as f:
+        f.write(content)
+        temp_path = f.name
+
+    yield temp_path
+
+    # Cleanup
+    if os.path.exists(temp_path):
+        os.unlink(temp_path)
+
+
+class TestContentExtractor:
+    """Tests for ContentExtractor class."""
     
     def test_initialization(self, sample_report):
         """Test ContentExtractor initialization."""
@@ -89,6 +95,25 @@ In conclusion, this work was successful.
         with pytest.raises(FileNotFoundError):
             ContentExtractor("nonexistent.tex")
     
+    def test_initialization_strips_bom(self):
+        """Test that a UTF-8 byte order mark is not kept in the content."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "report.tex")
+            with open(path, 'wb') as f:
+                f.write(b"\xef\xbb\xbf\\section{Introduction}\r\nText\xff here.\r\n")
+            
+            extractor = ContentExtractor(path)
+            
+            assert extractor.content == "\\section{Introduction}\nText here.\n"
+    
+    def test_extract_for_presentation_returns_fresh_result(self, sample_report):
+        """Test that mutating one presentation result does not affect the next."""
+        extractor = ContentExtractor(sample_report)
+        assert not hasattr(extractor, '__dict__')
+        first = extractor.extract_for_presentation()
+        first['objectives'].clear()
+        assert len(extractor.extract_for_presentation()['objectives']) == 3
+    
     def test_extract_introduction(self, sample_report):
         """Test extracting introduction content."""
         extractor = ContentExtractor(sample_report)
@@ -511,6 +536,29 @@ Conclusion content.
         finally:
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
+    
+    def test_extraction_cached_until_file_changes(self):
+        """Test that unchanged reports are parsed once and edits invalidate."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "report.tex")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(r"\section{Introduction}" + "\nFirst draft.\n")
+            
+            with patch(
+                'scripts.utils.content_extractor.ContentExtractor',
+                wraps=ContentExtractor,
+            ) as extractor:
+                first = extract_content_from_report(path)
+                first['introduction']['motivation'] = "mutated"
+                second = extract_content_from_report(path)
+                assert extractor.call_count == 1
+                assert second['introduction']['motivation'] == "First draft."
+                
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(r"\section{Introduction}" + "\nSecond, longer draft.\n")
+                third = extract_content_from_report(path)
+                assert extractor.call_count == 2
+                assert third['introduction']['motivation'] == "Second, longer draft."
 
 
 class TestContentExtractorAlternativeGoalNames:
@@ -920,3 +968,30 @@ This is the {chapter_type.lower()} of our work.
             finally:
                 if os.path.exists(temp_path):
                     os.unlink(temp_path)
+
+
+class TestExtractContentFromReports:
+    """Tests for extract_content_from_reports batch helper."""
+    
+    def test_batch_extraction(self):
+        """Test extracting several reports keyed by path."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = []
+            for name in ("first", "second"):
+                path = os.path.join(temp_dir, f"{name}.tex")
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(r"\section{Introduction}" + f"\nThe {name} report.\n")
+                paths.append(path)
+            missing = os.path.join(temp_dir, "missing.tex")
+            
+            results = extract_content_from_reports(paths + [missing], max_workers=2)
+            
+            assert list(results) == paths + [missing]
+            assert "first report" in results[paths[0]]['introduction']['motivation']
+            assert "second report" in results[paths[1]]['introduction']['motivation']
+            assert results[missing] is None
+    
+    def test_empty_batch(self):
+        """Test that an empty batch returns an empty mapping."""
+        assert extract_content_from_reports([]) == {}
+
@@ -24,6 +24,20 @@ class TestGenerateCLI:
         assert result.returncode == 0
         assert 'Generate professional LaTeX academic reports' in result.stdout
 
+    def test_import_does_not_load_heavy_dependencies(self):
+        """Test that importing generate.py defers yaml/jinja2 until needed."""
+        script_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        code = (
+            "import sys; import scripts.generate; "
+            "print(sorted(m for m in ('yaml', 'jinja2') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True, cwd=script_dir
+        )
+
+        assert result.returncode == 0
+        assert result.stdout.strip() == '[]'
+
     def test_cli_config_file_not_found(self):
         """Test error when config file doesn't exist."""
         script_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))       
@@ -167,6 +181,25 @@ class TestGenerateCLI:
             assert os.path.exists(os.path.join(output_dir, 'IEEEtran.bst'))
             assert os.path.exists(os.path.join(output_dir, 'proposal_refs.bib'))
 
+    def test_scan_tree_yields_nested_relative_paths(self):
+        """Test that the template scanner recurses and returns relative paths."""
+        from scripts.generate import _scan_tree
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.makedirs(os.path.join(temp_dir, 'chapters', 'appendix'))
+            Path(temp_dir, 'main.tex').write_text('x')
+            Path(temp_dir, 'chapters', 'intro.tex').write_text('x')
+            Path(temp_dir, 'chapters', 'appendix', 'logo.png').write_bytes(b'x')
+
+            found = dict(_scan_tree(temp_dir))
+
+            assert set(found) == {
+                'main.tex',
+                os.path.join('chapters', 'intro.tex'),
+                os.path.join('chapters', 'appendix', 'logo.png'),
+            }
+            assert found['main.tex'] == os.path.join(temp_dir, 'main.tex')
+
     def test_render_templates(self):
         """Test template rendering."""
         from scripts.generate import render_templates
@@ -193,6 +226,29 @@ class TestGenerateCLI:
                 assert 'Test' in content
                 assert 'Author' in content
 
+            # Rendering alone must not copy non-.tex assets
+            assert not os.path.exists(os.path.join(output_dir, 'IEEEtran.bst'))
+
+    def test_render_templates_reuses_environment(self):
+        """Test that the Jinja2 environment is built once per template directory."""
+        import scripts.generate as gen
+
+        script_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+        template_dir = os.path.join(script_dir, '..', 'templates', 'proposal')
+
+        env1 = gen._get_environment(template_dir)
+        env2 = gen._get_environment(os.path.normpath(template_dir) + os.sep)
+
+        assert env1 is env2
+        assert env1.auto_reload is False
+
+    def test_bytecode_cache_falls_back_when_unavailable(self):
+        """Test that an unusable cache directory disables bytecode caching."""
+        import scripts.generate as gen
+
+        with patch('jinja2.FileSystemBytecodeCache', side_effect=RuntimeError('no tmp')):
+            assert gen._get_bytecode_cache() is None
+
 
 class TestGenerateSimpleCLI:
     """Tests for generate_simple.py CLI functionality."""
@@ -288,6 +344,15 @@ class TestGenerateSimpleCLI:
 
         assert result == "Title: Test Title, Author: Test Author"
 
+    def test_simple_replace_blocks_and_unknown_keys(self):
+        """Test block cleanup and that unknown placeholders are left alone."""
+        from scripts.generate_simple import simple_replace
+
+        text = "\\BLOCK{if INCLUDE_ABSTRACT}{{TITLE}} \\VAR{MISSING}\\BLOCK{endif}\\BLOCK{if OTHER}"
+        result = simple_replace(text, {'TITLE': '\\VAR{TITLE}'})
+
+        assert result == "\\VAR{TITLE} \\VAR{MISSING}\\BLOCK{if OTHER}"
+
     def test_copy_and_process_files(self):
         """Test copying and processing files in simple version."""
         from scripts.generate_simple import copy_and_process_files
@@ -331,6 +396,22 @@ class TestConfigValidation:
         assert 'author' in config
         assert config['project']['type'] == 'proposal'
 
+    def test_load_config_file_uses_safe_loader(self):
+        """Test that the (possibly C-accelerated) YAML loader is a safe loader."""
+        import scripts.generate as gen
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = os.path.join(temp_dir, 'unsafe.yaml')
+            with open(config_path, 'w') as f:
+                f.write('project: !!python/object/apply:os.getcwd []\n')
+
+            with patch('yaml.load', wraps=yaml.load) as mock_load:
+                with pytest.raises(yaml.YAMLError):
+                    gen.load_config_file(config_path)
+
+            loader = mock_load.call_args.kwargs['Loader']
+            assert issubclass(loader, yaml.constructor.SafeConstructor)
+
     def test_load_config_file_json(self):
         """Test loading JSON config file."""
         # Use Python's json module directly for testing
@@ -392,6 +473,15 @@ class TestOutputDirectoryHandling:
             finally:
                 os.chdir(old_cwd)
 
+    def test_title_slug_strips_punctuation(self):
+        """Test that slug sanitizing keeps only alphanumerics and hyphens."""
+        from scripts.generate import _SLUG_RE
+        from scripts.generate_simple import _SLUG_RE as simple_slug_re
+
+        title = 'deep-learning:-a_study-(v2)!-café'
+        assert _SLUG_RE.sub('', title) == 'deep-learning-astudy-v2-café'
+        assert simple_slug_re.sub('', title) == 'deep-learning-astudy-v2-café'
+
     def test_custom_output_directory(self):
         """Test using custom output directory."""
         from scripts.generate import generate_report
@@ -617,6 +707,80 @@ class TestGenerateIntegration:
         assert context['ASPECT_RATIO_VALUE'] == '169'
 
 
+class TestIncrementalGeneration:
+    """Tests for mtime/context-hash based incremental regeneration."""
+
+    CONFIG = {
+        'project': {'title': 'Incremental', 'type': 'proposal'},
+        'author': {'name': 'Author', 'roll_number': '123'},
+        'academic': {'supervisor': 'Dr. X', 'department': 'CSE', 'university': 'Uni', 'degree': 'B.Tech', 'session': '2024'},
+        'dates': {'submission_date': 'Dec 2024'}
+    }
+
+    @pytest.mark.parametrize('module', ['scripts.generate', 'scripts.generate_simple'])
+    def test_incremental_skips_until_config_changes(self, module):
+        import copy
+        import importlib
+
+        gen = importlib.import_module(module)
+        config = copy.deepcopy(self.CONFIG)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            gen.generate_report(config, temp_dir, incremental=True)
+            assert os.path.isfile(os.path.join(temp_dir, '.ctxhash'))
+
+            tex_path = os.path.join(temp_dir, 'proposal.tex')
+            Path(tex_path).write_text('edited', encoding='utf-8')
+
+            gen.generate_report(copy.deepcopy(config), temp_dir, incremental=True)
+            assert Path(tex_path).read_text(encoding='utf-8') == 'edited'
+
+            config['author']['name'] = 'Someone Else'
+            gen.generate_report(config, temp_dir, incremental=True)
+            assert 'Someone Else' in Path(tex_path).read_text(encoding='utf-8')
+
+    @pytest.mark.parametrize('module', ['scripts.generate', 'scripts.generate_simple'])
+    def test_non_incremental_run_leaves_no_digest(self, module):
+        import copy
+        import importlib
+
+        gen = importlib.import_module(module)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            gen.generate_report(copy.deepcopy(self.CONFIG), temp_dir, incremental=True)
+            assert os.path.isfile(os.path.join(temp_dir, '.ctxhash'))
+
+            gen.generate_report(copy.deepcopy(self.CONFIG), temp_dir)
+            assert not os.path.exists(os.path.join(temp_dir, '.ctxhash'))
+
+    @pytest.mark.parametrize('module,writer', [
+        ('scripts.generate', '_render_to_file'),
+        ('scripts.generate_simple', '_substitute'),
+    ])
+    def test_failed_run_drops_stale_digest(self, module, writer):
+        import copy
+        import importlib
+
+        gen = importlib.import_module(module)
+        config = copy.deepcopy(self.CONFIG)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            gen.generate_report(copy.deepcopy(config), temp_dir, incremental=True)
+
+            config['author']['name'] = 'Someone Else'
+            with patch.object(gen, writer, side_effect=RuntimeError('render failed')):
+                with pytest.raises(RuntimeError):
+                    gen.generate_report(copy.deepcopy(config), temp_dir, incremental=True)
+            assert not os.path.exists(os.path.join(temp_dir, '.ctxhash'))
+
+            # The old configuration must now re-render instead of trusting
+            # outputs the failed run may have touched.
+            tex_path = os.path.join(temp_dir, 'proposal.tex')
+            Path(tex_path).write_text('partial', encoding='utf-8')
+            gen.generate_report(copy.deepcopy(self.CONFIG), temp_dir, incremental=True)
+            assert 'Author' in Path(tex_path).read_text(encoding='utf-8')
+
+
 class TestGenerateUserInputAndInteractive:
     """Cover get_user_input and collect_interactive_inputs branches."""
 
@@ -793,6 +957,61 @@ class TestGenerateMainInProcess:
             gen.main()
             assert os.path.isfile(os.path.join(out, 'proposal.tex'))
 
+    def test_main_dry_run_writes_nothing(self, monkeypatch, capsys):
+        import scripts.generate as gen
+
+        script_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        config_path = os.path.join(script_dir, 'examples/sample-proposal/config.yaml')
+        with tempfile.TemporaryDirectory() as tmp:
+            out = os.path.join(tmp, 'gen-out')
+            monkeypatch.setattr(
+                sys,
+                'argv',
+                ['generate.py', '--config', config_path, '--output', out, '--dry-run'],
+            )
+            gen.main()
+            assert not os.path.exists(out)
+            assert 'Type: proposal' in capsys.readouterr().out
+
+
+class TestPeekProjectHeader:
+    """Tests for reading only the project block of a YAML config."""
+
+    def _write(self, temp_dir, text):
+        path = os.path.join(temp_dir, 'config.yaml')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return path
+
+    def test_peek_small_file(self):
+        from scripts.generate import _peek_project_header
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write(temp_dir, 'project:\n  title: T\n  type: proposal\n')
+            assert _peek_project_header(path) == {'title': 'T', 'type': 'proposal'}
+
+    def test_peek_uses_prefix_when_block_closed(self):
+        import scripts.generate as gen
+
+        body = 'project:\n  title: T\n  type: proposal\nauthor:\n' + '  # pad\n' * 2000
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write(temp_dir, body)
+            with patch.object(gen, 'load_config_file') as mock_load:
+                assert gen._peek_project_header(path, prefix_size=64) == {
+                    'title': 'T', 'type': 'proposal'
+                }
+                mock_load.assert_not_called()
+
+    def test_peek_falls_back_when_block_truncated(self):
+        from scripts.generate import _peek_project_header
+
+        body = 'project:\n  title: T\n' + '  # pad\n' * 50 + '  type: thesis\n'
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write(temp_dir, body)
+            assert _peek_project_header(path, prefix_size=64) == {
+                'title': 'T', 'type': 'thesis'
+            }
+
 
 class TestGenerateMainSubprocess:
     """Exercise generate.py main() via subprocess."""
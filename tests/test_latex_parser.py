@@ -8,82 +8,90 @@ from scripts.utils.latex_parser import (
     extract_itemize_list,
     extract_first_paragraph,
     clean_latex,
-    extract_chapter
+    extract_chapter,
+    LatexIndex
 )
 
 
+# Documents shared by the present/missing cases below.
+SECTION_DOC = "\\section{Introduction}\nThis is the introduction.\n\\section{Methods}\nMethods content"
+SUBSECTION_DOC = "\\subsection{Motivation}\nMotivation content\n\\subsection{Other}\nOther content"
+ABSTRACT_DOC = "\\begin{abstract}\nThis is the abstract.\n\\end{abstract}"
+ITEMIZE_DOC = "\\begin{itemize}\n\\item First\n\\item Second\n\\end{itemize}"
+CHAPTER_DOC = "\\chapter{Introduction}\nChapter content\n\\chapter{Methods}\nMethods content"
+
+# (extractor, content, name, text expected in the result or None if absent)
+EXTRACT_CASES = [
+    pytest.param(extract_section, SECTION_DOC, "Introduction", "This is the introduction", id="section"),
+    pytest.param(extract_section, SECTION_DOC, "Conclusion", None, id="section-missing"),
+    pytest.param(extract_section, SECTION_DOC, "INTRODUCTION", "This is the introduction", id="section-case-insensitive"),
+    pytest.param(
+        extract_section, "\\section{Problem Statement}\nContent",
+        "Problem Statement", "Content", id="section-with-space",
+    ),
+    pytest.param(extract_subsection, SUBSECTION_DOC, "Motivation", "Motivation content", id="subsection"),
+    pytest.param(extract_subsection, SUBSECTION_DOC, "Goals", None, id="subsection-missing"),
+    pytest.param(extract_environment, ABSTRACT_DOC, "abstract", "This is the abstract", id="environment-abstract"),
+    pytest.param(extract_environment, ITEMIZE_DOC, "itemize", "\\item First", id="environment-itemize"),
+    pytest.param(extract_environment, ABSTRACT_DOC, "figure", None, id="environment-missing"),
+    pytest.param(extract_chapter, CHAPTER_DOC, "Introduction", "Chapter content", id="chapter"),
+    pytest.param(extract_chapter, CHAPTER_DOC, "Conclusion", None, id="chapter-missing"),
+]
+
+
+class TestExtractPresentOrMissing:
+    """Tests shared by the section, subsection, environment and chapter extractors."""
+    
+    @pytest.mark.parametrize("extractor,content,name,expected", EXTRACT_CASES)
+    def test_extract(self, extractor, content, name, expected):
+        """Test that a present block is returned and a missing one gives None."""
+        result = extractor(content, name)
+        if expected is None:
+            assert result is None
+        else:
+            assert result is not None
+            assert expected in result
+
+
 class TestExtractSection:
     """Tests for extract_section function."""
     
-    def test_extract_existing_section(self):
-        """Test extracting an existing section."""
-        content = r"\section{Introduction}" + "\nThis is the introduction.\n" + r"\section{Methods}" + "\nMethods content"
-        result = extract_section(content, "Introduction")
-        assert result is not None
-        assert "This is the introduction" in result
-    
-    def test_extract_missing_section(self):
-        """Test extracting a non-existent section."""
-        content = r"\section{Introduction}" + "\nContent"
+    def test_extract_section_stops_at_end_document(self):
+        """Test that the last section does not swallow \\end{document}."""
+        content = r"\section{Conclusion}" + "\nDone.\n" + r"\end{document}"
         result = extract_section(content, "Conclusion")
-        assert result is None
-    
-    
-    def test_extract_section_case_insensitive(self):
-        """Test that section extraction is case-insensitive."""
-        content = r"\section{INTRODUCTION}" + "\nContent"
-        result = extract_section(content, "introduction")
-        # Implementation uses case-insensitive matching
-        assert result is not None
-        assert "Content" in result
-    
-    def test_extract_section_with_special_chars(self):
-        """Test extracting section with special characters in name."""
-        content = r"\section{Problem Statement}" + "\nContent"
-        result = extract_section(content, "Problem Statement")
-        assert result is not None
-        assert "Content" in result
+        assert result == "Done."
 
+    def test_extract_section_name_with_regex_metacharacters(self):
+        """Test that section names are matched literally, not as regexes."""
+        content = r"\section{C++ Results (Draft)}" + "\nBody\n" + r"\section{CCC Results Draft}" + "\nOther"
+        assert extract_section(content, "C++ Results (Draft)") == "Body"
+        assert extract_section(content, "C+") == "Body"
+        assert extract_subsection(r"\subsection{a.b}" + "\nX", "a*b") is None
 
-class TestExtractSubsection:
-    """Tests for extract_subsection function."""
-    
-    def test_extract_existing_subsection(self):
-        """Test extracting an existing subsection."""
-        content = r"\subsection{Motivation}" + "\nMotivation content\n" + r"\subsection{Other}" + "\nOther content"
-        result = extract_subsection(content, "Motivation")
-        assert result is not None
-        assert "Motivation content" in result
-    
-    def test_extract_missing_subsection(self):
-        """Test extracting a non-existent subsection."""
-        content = r"\subsection{Motivation}" + "\nContent"
-        result = extract_subsection(content, "Goals")
-        assert result is None
+    def test_extract_section_title_substring(self):
+        """Test the fallback matches a substring of a single heading title."""
+        content = r"\section{Research Objectives}" + "\nGoals\n" + r"\section{Intro}" + "\nObjectives}"
+        assert extract_section(content, "objectives") == "Goals"
+        assert extract_section(r"\section{Intro}" + "\nObjectives}", "Objectives") is None
+
+    def test_extract_starred_and_spaced_headings(self):
+        """Test unnumbered headings and whitespace before the title brace."""
+        content = r"\chapter*{Abstract}" + "\nSummary\n" + r"\section* {Intro}" + "\nBody\n" + r"\section{Next}"
+        index = LatexIndex(content)
+        assert extract_section(content, "Intro") == index.section("Intro") == "Body"
+        assert extract_section(content, "intr") == "Body"
+        assert extract_chapter(content, "Abstract").startswith("Summary")
+        assert index.chapter("Abstract") == extract_chapter(content, "Abstract")
 
 
 class TestExtractEnvironment:
     """Tests for extract_environment function."""
     
-    def test_extract_abstract(self):
-        """Test extracting abstract environment."""
-        content = r"\begin{abstract}" + "\nThis is the abstract.\n" + r"\end{abstract}"
-        result = extract_environment(content, "abstract")
-        # strip() is called in implementation
-        assert "This is the abstract" in result # type: ignore
-    
-    def test_extract_itemize(self):
-        """Test extracting itemize environment."""
-        content = r"\begin{itemize}" + "\n" + r"\item First" + "\n" + r"\item Second" + "\n" + r"\end{itemize}"
-        result = extract_environment(content, "itemize")
-        assert result is not None
-        assert r"\item First" in result
-    
-    def test_extract_missing_environment(self):
-        """Test extracting non-existent environment."""
-        content = r"\begin{abstract}" + "\nContent\n" + r"\end{abstract}"
-        result = extract_environment(content, "figure")
-        assert result is None
+    def test_extract_starred_environment(self):
+        """Test that environment names such as figure* are matched literally."""
+        content = r"\begin{figuree}" + "\nWrong\n" + r"\end{figuree}" + r"\begin{figure*}" + "\nWide\n" + r"\end{figure*}"
+        assert extract_environment(content, "figure*") == "Wide"
 
 
 class TestExtractItemizeList:
@@ -105,6 +113,11 @@ class TestExtractItemizeList:
         result = extract_itemize_list(content)
         assert len(result) == 0
     
+    def test_extract_list_skips_item_lookalikes(self):
+        """Test that \\itemsep is not an item and an unterminated item is dropped."""
+        content = r"\begin{itemize}\itemsep0pt \item First \item Second\end{itemize} \item Stray"
+        assert extract_itemize_list(content) == ["First", "Second"]
+
     def test_extract_list_with_latex_commands(self):
         """Test extracting list items containing LaTeX commands."""
         content = r"\item \textbf{Bold item}" + "\n" + r"\item \textit{Italic item}" + "\n" + r"\end{itemize}"
@@ -149,6 +162,13 @@ class TestCleanLatex:
         assert "  " not in result
         assert "Text with multiple spaces" == result
 
+    def test_nested_commands(self):
+        """Test that nested and argument-embedded commands are all removed."""
+        assert clean_latex(r"\textbf{\textit{x}}") == "x"
+        assert clean_latex(r"\textbf{Note \cite{a} more}") == "Note more"
+        assert clean_latex(r"\href{http://x}{see \emph{this}}") == "see this"
+        assert clean_latex(r"\textbf{50% done}" + "\nnext") == "50 next"
+
 
 class TestExtractFirstParagraph:
     """Tests for extract_first_paragraph function."""
@@ -198,20 +218,54 @@ class TestExtractFirstParagraph:
         assert len(result) < len(content)
         # Should be within reasonable length
         assert len(result) <= 50  # Allow for some buffer
+    
+    def test_paragraph_end_beyond_search_window(self):
+        """Test paragraph ends past, and straddling, the initial search window."""
+        # The window for max_length=10 is the first 90 characters.
+        far = "x " * 100 + "\n\nRest"
+        assert extract_first_paragraph(far, max_length=10) == "x x x x x..."
+        straddling = "\\textbf{" + "y" * 79 + "}\\section{Next}"
+        assert extract_first_paragraph(straddling, max_length=10) == "y" * 10 + "..."
 
 
-class TestExtractChapter:
-    """Tests for extract_chapter function."""
-    
-    def test_extract_existing_chapter(self):
-        """Test extracting an existing chapter."""
-        content = r"\chapter{Introduction}\nChapter content\n\chapter{Methods}\nMethods content"
-        result = extract_chapter(content, "Introduction")
-        assert result is not None
-        assert "Chapter content" in result
-    
-    def test_extract_missing_chapter(self):
-        """Test extracting a non-existent chapter."""
-        content = r"\chapter{Introduction}\nContent"
-        result = extract_chapter(content, "Conclusion")
-        assert result is None
+class TestLatexIndex:
+    """Tests for LatexIndex lookups."""
+
+    DOCUMENT = (
+        r"\chapter{Introduction}" "\nChapter intro\n"
+        r"\section{Background}" "\nBackground text\n"
+        r"\subsection{Objectives}" "\nGoal one\n"
+        r"\subsection{Scope}" "\nScope text\n"
+        r"\section{Background}" "\nDuplicate heading\n"
+        r"\chapter{Results}" "\nResults text\n"
+        r"\end{document}" "\nTrailing"
+    )
+
+    @pytest.mark.parametrize("kind,name", [
+        ("section", "Background"),
+        ("section", "background"),
+        ("subsection", "Objectives"),
+        ("subsection", "Scope"),
+        ("chapter", "Introduction"),
+        ("chapter", "Results"),
+        ("chapter", "Result"),
+        ("section", "Missing"),
+    ])
+    def test_matches_module_functions(self, kind, name):
+        """Test that index lookups agree with the regex extractors."""
+        extractors = {
+            "section": extract_section,
+            "subsection": extract_subsection,
+            "chapter": extract_chapter,
+        }
+        index = LatexIndex(self.DOCUMENT)
+        expected = extractors[kind](self.DOCUMENT, name)
+        assert getattr(index, kind)(name) == expected
+
+    def test_first_heading_wins(self):
+        """Test that a repeated title resolves to its first occurrence."""
+        index = LatexIndex(self.DOCUMENT)
+        result = index.section("Background")
+        assert "Background text" in result
+        assert "Duplicate heading" not in result
+
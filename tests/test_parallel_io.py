@@ -3,10 +3,12 @@
 import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 from scripts.utils.parallel_io import (
     copy_file_with_progress,
     copy_files_parallel,
     get_files_to_copy,
+    iter_files_to_copy,
     copy_directory_parallel
 )
 
@@ -98,6 +100,32 @@ class TestCopyFileWithProgress:
             assert success is True
             with open(dst_file, 'rb') as f:
                 assert f.read() == b'\x00\x01\x02\x03\x04'
+    
+    def test_copy_falls_back_when_kernel_copy_fails(self):
+        """Test that a failing os.copy_file_range falls back to a normal copy."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src_file = os.path.join(temp_dir, "source.txt")
+            dst_file = os.path.join(temp_dir, "dest.txt")
+            Path(src_file).write_text("test content")
+            
+            with patch("os.copy_file_range", side_effect=OSError, create=True):
+                filename, success = copy_file_with_progress(src_file, dst_file)
+            
+            assert success is True
+            assert Path(dst_file).read_text() == "test content"
+    
+    def test_copy_falls_back_when_kernel_copy_returns_zero(self):
+        """Test that a copy_file_range reporting 0 bytes does not truncate the copy."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src_file = os.path.join(temp_dir, "source.txt")
+            dst_file = os.path.join(temp_dir, "dest.txt")
+            Path(src_file).write_text("test content")
+            
+            with patch("os.copy_file_range", return_value=0, create=True):
+                filename, success = copy_file_with_progress(src_file, dst_file)
+            
+            assert success is True
+            assert Path(dst_file).read_text() == "test content"
 
 
 class TestGetFilesToCopy:
@@ -183,6 +211,40 @@ class TestGetFilesToCopy:
             )
             
             assert len(files) == 1
+    
+    def test_exclude_directories_and_globs(self):
+        """Test that exact names prune directories and globs match whole names."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src_dir = os.path.join(temp_dir, "src")
+            dst_dir = os.path.join(temp_dir, "dst")
+            
+            os.makedirs(os.path.join(src_dir, ".git", "objects"))
+            Path(os.path.join(src_dir, ".git", "objects", "pack")).write_text("x")
+            Path(os.path.join(src_dir, "main.tex")).write_text("tex")
+            Path(os.path.join(src_dir, "main.aux")).write_text("aux")
+            Path(os.path.join(src_dir, "main.auxiliary")).write_text("kept")
+            
+            files = get_files_to_copy(src_dir, dst_dir, exclude_patterns=[".git", "*.aux"])
+            
+            names = sorted(os.path.basename(src) for src, _ in files)
+            assert names == ["main.auxiliary", "main.tex"]
+    
+    def test_iter_files_to_copy_is_lazy(self):
+        """Test that pairs are yielded lazily with nested destinations."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src_dir = os.path.join(temp_dir, "src")
+            dst_dir = os.path.join(temp_dir, "dst")
+            
+            os.makedirs(os.path.join(src_dir, "a", "b"))
+            Path(os.path.join(src_dir, "a", "b", "deep.txt")).write_text("content")
+            
+            pairs = iter_files_to_copy(src_dir, dst_dir)
+            
+            assert not isinstance(pairs, list)
+            assert list(pairs) == [(
+                os.path.join(src_dir, "a", "b", "deep.txt"),
+                os.path.join(dst_dir, "a", "b", "deep.txt"),
+            )]
 
 
 class TestCopyFilesParallel:
@@ -245,6 +307,47 @@ class TestCopyFilesParallel:
             assert count == 3
             assert len(callback_calls) == 3
     
+    def test_copy_batches_small_files(self):
+        """Test that batched small files and a large file all report progress."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src_dir = os.path.join(temp_dir, "src")
+            dst_dir = os.path.join(temp_dir, "dst")
+            os.makedirs(src_dir)
+            os.makedirs(dst_dir)
+            
+            files = []
+            for i in range(40):
+                src_file = os.path.join(src_dir, f"file{i}.txt")
+                Path(src_file).write_text(f"content{i}")
+                files.append((src_file, os.path.join(dst_dir, f"file{i}.txt")))
+            big_file = os.path.join(src_dir, "big.bin")
+            Path(big_file).write_bytes(b"\0" * (256 * 1024))
+            files.append((big_file, os.path.join(dst_dir, "big.bin")))
+            
+            callback_calls = []
+            count = copy_files_parallel(
+                files, progress_callback=lambda name, ok: callback_calls.append(name)
+            )
+            
+            assert count == 41
+            assert sorted(callback_calls) == sorted(os.path.basename(src) for src, _ in files)
+            assert Path(os.path.join(dst_dir, "file39.txt")).read_text() == "content39"
+    
+    def test_copy_creates_destination_directories(self):
+        """Test that missing destination directories are created up front."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src_file = os.path.join(temp_dir, "source.txt")
+            Path(src_file).write_text("content")
+            files = [
+                (src_file, os.path.join(temp_dir, "out", "a", "one.txt")),
+                (src_file, os.path.join(temp_dir, "out", "a", "b", "two.txt")),
+            ]
+            
+            count = copy_files_parallel(files)
+            
+            assert count == 2
+            assert all(os.path.exists(dst) for _, dst in files)
+    
     def test_copy_with_max_workers(self):
         """Test with specified max workers."""
         with tempfile.TemporaryDirectory() as temp_dir:
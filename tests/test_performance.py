@@ -1,8 +1,12 @@
 """Tests for performance optimization utilities."""
 
+import os
 import pytest
+import tempfile
 import time
+from scripts.utils import performance
 from scripts.utils.performance import (
+    get_bytecode_cache,
     get_cached_template_environment,
     clear_template_cache,
     memoize,
@@ -46,6 +50,18 @@ class TestGetCachedTemplateEnvironment:
         env2 = get_cached_template_environment("/tmp/templates")
         # After clearing, should create new environment
         assert env1 is not env2
+    
+    def test_bytecode_cache_honours_env_var(self, monkeypatch):
+        """Test that IITJ_JINJA_CACHE_DIR selects and creates the cache directory."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_dir = os.path.join(temp_dir, "jinja")
+            monkeypatch.setenv("IITJ_JINJA_CACHE_DIR", cache_dir)
+            
+            cache = get_bytecode_cache()
+            
+            assert cache is not None
+            assert cache.directory == cache_dir
+            assert os.path.isdir(cache_dir)
 
 
 class TestMemoize:
@@ -133,6 +149,38 @@ class TestMemoize:
         assert result2 == 6
         assert result3 == 7
         assert call_count == 2
+    
+    def test_memoize_cache_is_bounded(self):
+        """Test that memoize evicts least recently used results."""
+        call_count = 0
+        
+        @memoize
+        def square(x):
+            nonlocal call_count
+            call_count += 1
+            return x * x
+        
+        for i in range(200):
+            square(i)
+        assert square.cache_info().currsize == 128
+        
+        square(0)  # Evicted long ago, so recomputed
+        assert call_count == 201
+    
+    def test_memoize_unhashable_arguments_bypass_cache(self):
+        """Test that list and dict arguments are computed without caching."""
+        call_count = 0
+        
+        @memoize
+        def total(values, weights=None):
+            nonlocal call_count
+            call_count += 1
+            return sum(values)
+        
+        assert total([1, 2, 3]) == 6
+        assert total([1, 2, 3], weights={"a": 1}) == 6
+        assert call_count == 2
+        assert total.cache_info().currsize == 0
 
 
 class TestTimed:
@@ -178,6 +226,11 @@ class TestTimed:
 class TestPerformanceProfiler:
     """Tests for PerformanceProfiler class."""
     
+    @pytest.fixture(autouse=True)
+    def enable_profiling(self, monkeypatch):
+        """Turn profiling on, as IITJ_PROFILE=1 would."""
+        monkeypatch.setattr(performance, "PROFILING_ENABLED", True)
+    
     def test_profiler_initialization(self):
         """Test profiler initialization."""
         profiler = PerformanceProfiler()
@@ -271,6 +324,18 @@ class TestPerformanceProfiler:
         
         # Operation should not be in timings
         assert "non_existent" not in profiler.timings
+    
+    def test_profiler_totals_in_nanoseconds(self):
+        """Test that totals are integer ns and in-flight starts stay hidden."""
+        profiler = PerformanceProfiler()
+        
+        profiler.start("cache_start")
+        profiler.start("pending")
+        profiler.end("cache_start")
+        
+        assert isinstance(profiler.totals["cache_start"], int)
+        assert list(profiler.timings) == ["cache_start"]
+        assert profiler.timings["cache_start"] == profiler.totals["cache_start"] / 1e9
 
 
 class TestGetProfiler:
@@ -291,6 +356,11 @@ class TestGetProfiler:
 class TestProfileOperation:
     """Tests for profile_operation decorator."""
     
+    @pytest.fixture(autouse=True)
+    def enable_profiling(self, monkeypatch):
+        """Turn profiling on, as IITJ_PROFILE=1 would."""
+        monkeypatch.setattr(performance, "PROFILING_ENABLED", True)
+    
     def test_profile_operation_decorator(self):
         """Test profile_operation decorator."""
         @profile_operation("test_op")
@@ -357,3 +427,30 @@ class TestProfileOperation:
         operation(15)
         
         assert profiler.counts["multi_call_op"] == 3
+
+
+class TestProfilingDisabled:
+    """Tests for the default, IITJ_PROFILE-unset behaviour."""
+    
+    @pytest.fixture(autouse=True)
+    def disable_profiling(self, monkeypatch):
+        """Turn profiling off regardless of the test environment."""
+        monkeypatch.setattr(performance, "PROFILING_ENABLED", False)
+    
+    def test_profiler_records_nothing(self):
+        """Test that start/end are no-ops when profiling is disabled."""
+        profiler = PerformanceProfiler()
+        
+        profiler.start("op")
+        profiler.end("op")
+        
+        assert profiler.timings == {}
+        assert profiler.counts == {}
+    
+    def test_profile_operation_returns_function_unwrapped(self):
+        """Test that the decorator does not install a wrapper."""
+        def operation():
+            return "result"
+        
+        assert profile_operation("op")(operation) is operation
+
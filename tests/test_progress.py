@@ -1,5 +1,9 @@
 """Tests for progress tracking utilities."""
 
+import pytest
+import time
+from contextlib import nullcontext
+from unittest.mock import patch
 from scripts.utils.progress import (
     ProgressBar,
     Spinner,
@@ -9,6 +13,16 @@ from scripts.utils.progress import (
 )
 
 
+@pytest.fixture
+def running_spinner():
+    """Yield a started Spinner, stopping it if the test did not."""
+    spinner = Spinner("Processing")
+    spinner.start()
+    yield spinner
+    if spinner.running:
+        spinner.stop()
+
+
 class TestProgressBar:
     """Tests for ProgressBar class."""
     
@@ -19,19 +33,18 @@ class TestProgressBar:
         assert progress.current == 0
         assert progress.description == "Testing"
     
-    def test_update(self):
-        """Test updating progress."""
-        progress = ProgressBar(10)
-        progress.update(5)
-        assert progress.current == 5
-        progress.update(3)
-        assert progress.current == 8
-    
-    def test_update_beyond_total(self):
-        """Test that update doesn't exceed total."""
+    @pytest.mark.parametrize("steps,expected", [
+        pytest.param([5], 5, id="one_update"),
+        pytest.param([5, 3], 8, id="two_updates"),
+        pytest.param([15], 10, id="beyond_total"),
+        pytest.param([6, 6], 10, id="accumulates_beyond_total"),
+    ])
+    def test_update(self, steps, expected):
+        """Test that updates accumulate and never exceed the total."""
         progress = ProgressBar(10)
-        progress.update(15)
-        assert progress.current == 10
+        for step in steps:
+            progress.update(step)
+        assert progress.current == expected
     
     def test_finish(self):
         """Test finishing progress."""
@@ -50,61 +63,48 @@ class TestSpinner:
         assert spinner.description == "Loading"
         assert spinner.running == False
     
-    def test_start_stop(self):
+    def test_start_stop(self, running_spinner):
         """Test starting and stopping spinner."""
-        spinner = Spinner("Processing")
-        spinner.start()
-        assert spinner.running == True
-        spinner.stop()
-        assert spinner.running == False
+        assert running_spinner.running == True
+        running_spinner.stop()
+        assert running_spinner.running == False
+
+
+def _outcome(raise_exc):
+    """Expect the ValueError a context body raises, or nothing."""
+    return pytest.raises(ValueError) if raise_exc else nullcontext()
 
 
 class TestProgressContext:
     """Tests for progress_context context manager."""
     
-    def test_context_manager(self):
-        """Test progress_context as context manager."""
-        with progress_context(10, "Testing") as progress:
-            assert isinstance(progress, ProgressBar)
-            assert progress.total == 10
-            progress.update(5)
-            assert progress.current == 5
-        # Progress should be finished after context
-        assert progress.current == 10
-    
-    def test_context_with_exception(self):
-        """Test that progress finishes even with exception."""
-        try:
+    @pytest.mark.parametrize("raise_exc", [False, True], ids=["normal", "exception"])
+    def test_context_finishes_progress(self, raise_exc):
+        """Test that progress is finished on exit, even when the body raises."""
+        with _outcome(raise_exc):
             with progress_context(10, "Testing") as progress:
+                assert isinstance(progress, ProgressBar)
+                assert progress.total == 10
                 progress.update(5)
-                raise ValueError("Test error")
-        except ValueError:
-            pass
-        # Progress should still be finished
-        assert progress.current == 10 # type: ignore
+                assert progress.current == 5
+                if raise_exc:
+                    raise ValueError("Test error")
+        assert progress.current == 10
 
 
 class TestSpinnerContext:
     """Tests for spinner_context context manager."""
     
-    def test_context_manager(self):
-        """Test spinner_context as context manager."""
-        with spinner_context("Loading") as spinner:
-            assert isinstance(spinner, Spinner)
-            assert spinner.running == True
-        # Spinner should be stopped after context
-        assert spinner.running == False
-    
-    def test_context_with_exception(self):
-        """Test that spinner stops even with exception."""
-        try:
-            with spinner_context("Processing") as spinner:
+    @pytest.mark.parametrize("raise_exc", [False, True], ids=["normal", "exception"])
+    def test_context_stops_spinner(self, raise_exc):
+        """Test that the spinner is stopped on exit, even when the body raises."""
+        with _outcome(raise_exc):
+            with spinner_context("Loading") as spinner:
+                assert isinstance(spinner, Spinner)
                 assert spinner.running == True
-                raise ValueError("Test error")
-        except ValueError:
-            pass
-        # Spinner should still be stopped
-        assert spinner.running == False # type: ignore
+                if raise_exc:
+                    raise ValueError("Test error")
+        assert spinner.running == False
 
 
 class TestWithProgressDecorator:
@@ -127,6 +127,27 @@ class TestWithProgressDecorator:
         
         result = add(2, 3)
         assert result == 5
+    
+    def test_decorator_skips_spinner_without_tty(self, capsys):
+        """Test that no spinner frames are written when stdout is not a TTY."""
+        @with_progress("Exporting")
+        def export():
+            return "done"
+        
+        assert export() == "done"
+        assert capsys.readouterr().out == "[OK] Exporting complete\n"
+    
+    def test_decorator_spins_on_tty(self, capsys):
+        """Test that the spinner runs when stdout is a terminal."""
+        @with_progress("Exporting")
+        def export():
+            return "done"
+        
+        with patch("scripts.utils.progress._stdout_is_tty", return_value=True):
+            assert export() == "done"
+        out = capsys.readouterr().out
+        assert "Exporting" in out.split("[OK]")[0]
+        assert out.endswith("[OK] Exporting complete\n")
 
 
 class TestProgressBarEdgeCases:
@@ -152,7 +173,6 @@ class TestProgressBarEdgeCases:
     
     def test_progress_eta_calculation_with_update(self):
         """Test ETA calculation when current > 0 (line 49)."""
-        import time
         progress = ProgressBar(10, "Processing")
         # Update to non-zero
         progress.update(5)
@@ -168,6 +188,27 @@ class TestProgressBarEdgeCases:
         progress = ProgressBar(10, "Test")
         progress.update(5)
         assert progress.current == 5
+    
+    def test_progress_repaints_are_throttled(self, capsys):
+        """Test that rapid updates paint once, plus the final step."""
+        with patch("scripts.utils.progress._stdout_is_tty", return_value=True):
+            progress = ProgressBar(1000, "Fast")
+        for _ in range(1000):
+            progress.update()
+        
+        out = capsys.readouterr().out
+        assert 1 < out.count("\r") < 100
+        assert out.endswith("(1000/1000) ETA: 0s\n")
+    
+    def test_progress_without_tty_writes_only_final_bar(self, capsys):
+        """Test that intermediate repaints are skipped when stdout is not a TTY."""
+        progress = ProgressBar(3, "Piped", width=3)
+        progress.update()
+        progress.update()
+        assert capsys.readouterr().out == ""
+        
+        progress.update()
+        assert capsys.readouterr().out == "\rPiped [███] 100% (3/3) ETA: 0s\n"
 
 
 class TestSpinnerEdgeCases:
@@ -182,27 +223,41 @@ class TestSpinnerEdgeCases:
         # Should not raise error
         assert spinner.running == False
     
-    def test_spinner_stop_with_message(self):
-        """Test spinner stop with final message (line 101)."""
-        spinner = Spinner("Processing")
-        spinner.start()
-        assert spinner.running == True
-        spinner.stop(final_message="Completed!")
-        assert spinner.running == False
+    @pytest.mark.parametrize("final_message", ["Completed!", None], ids=["message", "no_message"])
+    def test_spinner_stop(self, running_spinner, capsys, final_message):
+        """Test spinner stop with and without a final message."""
+        running_spinner.stop(final_message=final_message)
+        assert running_spinner.running == False
+        out = capsys.readouterr().out
+        assert out.endswith("Completed!\n" if final_message else "\r")
+    
+    def test_spinner_frame_cycling(self, running_spinner):
+        """Test that spinner cycles through frames."""
+        frame = running_spinner.frame_index
+        running_spinner._display()
+        # Frame index should increment
+        assert running_spinner.frame_index > frame
     
-    def test_spinner_stop_without_message(self):
-        """Test spinner stop without message."""
-        spinner = Spinner("Processing")
+    def test_spinner_animates_in_background(self):
+        """Test that frames advance without manual _display calls."""
+        spinner = Spinner("Waiting")
+        spinner.INTERVAL = 0.01
         spinner.start()
-        assert spinner.running == True
+        time.sleep(0.1)
         spinner.stop()
-        assert spinner.running == False
+        
+        frames = spinner.frame_index
+        assert frames > 2
+        time.sleep(0.05)
+        assert spinner.frame_index == frames
     
-    def test_spinner_frame_cycling(self):
-        """Test that spinner cycles through frames."""
-        spinner = Spinner("Test")
-        initial_frame = spinner.frame_index
+    def test_spinner_stop_does_not_wait_for_next_frame(self):
+        """Test that stop() wakes the animation thread immediately."""
+        spinner = Spinner("Waiting")
+        spinner.INTERVAL = 5
         spinner.start()
-        spinner._display()
-        # Frame index should increment
-        assert spinner.frame_index > initial_frame
+        
+        started = time.perf_counter()
+        spinner.stop()
+        assert time.perf_counter() - started < 1
+        assert spinner._thread is None
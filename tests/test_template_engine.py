@@ -124,6 +124,20 @@ class TestGetTemplateEnvironment:
             env2 = get_template_environment(temp_dir)
             # Both calls should return the same object
             assert env1 is env2
+    
+    def test_environment_registers_latex_escape(self):
+        """Test that the cached environment renders with the latex_escape filter."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            template_path = os.path.join(temp_dir, "t.tex")
+            output_path = os.path.join(temp_dir, "out.tex")
+            with open(template_path, 'w', encoding='utf-8') as f:
+                f.write("\\VAR{NAME|latex_escape}")
+            
+            render_template(template_path, {"NAME": "R&D_1"}, output_path)
+            
+            with open(output_path, encoding='utf-8') as f:
+                assert f.read() == "R\\&D\\_1"
+            assert get_template_environment(temp_dir).filters["latex_escape"] is latex_escape
 
 
 class TestPrepareContext:
@@ -308,6 +322,19 @@ class TestPrepareContext:
         assert context['BIBLIOGRAPHY_STYLE'] == "IEEE"
         assert context['THEME'] == "Madrid"
         assert context['ASPECT_RATIO'] == "16:9"
+    
+    def test_context_with_null_sections(self):
+        """Test that sections left empty in YAML fall back to defaults."""
+        config = {
+            "project": None,
+            "academic": {"department": "Computer Science"},
+            "presentation": None
+        }
+        
+        context = prepare_context(config)
+        assert context['TITLE'] == ""
+        assert context['SUPERVISOR_DEPARTMENT'] == "Computer Science"
+        assert context['ASPECT_RATIO_VALUE'] == "169"
 
 
 class TestEnvironmentCaching:
@@ -421,6 +448,24 @@ class TestRenderTemplate:
             assert os.path.exists(output_path)
             assert os.path.isfile(output_path)
     
+    def test_render_template_recreates_removed_output_directory(self):
+        """Test rendering again after the cached output directory is deleted."""
+        import shutil
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            template_path = os.path.join(temp_dir, "template.tex")
+            output_dir = os.path.join(temp_dir, "output")
+            output_path = os.path.join(output_dir, "file.tex")
+            with open(template_path, 'w') as f:
+                f.write("Hello \\VAR{NAME}")
+            
+            render_template(template_path, {"NAME": "World"}, output_path)
+            shutil.rmtree(output_dir)
+            render_template(template_path, {"NAME": "Again"}, output_path)
+            
+            with open(output_path, 'r') as f:
+                assert f.read() == "Hello Again"
+    
     def test_render_template_with_utf8_content(self):
         """Test rendering template with UTF-8 content."""
         with tempfile.TemporaryDirectory() as temp_dir:
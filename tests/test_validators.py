@@ -389,6 +389,29 @@ class TestValidateConfig:
         finally:
             os.unlink(temp_logo)
     
+    def test_logo_removed_between_runs(self):
+        """Test that each validation run re-checks the logo file."""
+        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
+            temp_logo = f.name
+        
+        config = {
+            "project": {"title": "My Project", "type": "proposal"},
+            "author": {"name": "John Doe", "roll_number": "12345"},
+            "academic": {
+                "supervisor": "Dr. Smith",
+                "department": "CSE",
+                "university": "IITJ",
+                "degree": "B.Tech"
+            },
+            "assets": {"logo_path": temp_logo}
+        }
+        assert validate_config(config)[0] is True
+        
+        os.unlink(temp_logo)
+        is_valid, errors = validate_config(config)
+        assert is_valid is False
+        assert any("logo" in error.lower() for error in errors)
+    
     def test_empty_email_field(self):
         """Test config with empty email field."""
         config = {
@@ -419,3 +442,30 @@ class TestValidateConfig:
         }
         is_valid, errors = validate_config(config)
         assert is_valid is True
+    
+    def test_null_sections(self):
+        """Test config whose sections were left empty in YAML."""
+        config = {"project": None, "author": None, "assets": None}
+        is_valid, errors = validate_config(config)
+        assert is_valid is False
+        assert errors == [
+            "Missing required fields: project.title, project.type, author.name, "
+            "author.roll_number, academic.supervisor, academic.department, "
+            "academic.university, academic.degree"
+        ]
+    
+    def test_plain_value_sections(self):
+        """Test config whose sections are plain values instead of mappings."""
+        config = {
+            "project": "prototype",
+            "author": "John",
+            "academic": {},
+            "assets": "logo.png"
+        }
+        is_valid, errors = validate_config(config)
+        assert is_valid is False
+        assert errors == [
+            "Missing required fields: project.title, project.type, author.name, "
+            "author.roll_number, academic.supervisor, academic.department, "
+            "academic.university, academic.degree"
+        ]